@@ -0,0 +1,32 @@
+"""Numba decorators, or pass-through stand-ins when numba is not installed.
+
+numba is optional: without it the decorated kernels run as plain Python
+and NumPy, slower but with identical results.
+"""
+try:
+    from numba import njit, prange, vectorize
+except ImportError:
+    prange = range
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+    def vectorize(*args, **kwargs):
+        # The kernels it wraps are written to broadcast over arrays as-is
+        return lambda fn: fn
+else:
+    if __package__:
+        # numba keys its on-disk cache by source file, not module, so kernels
+        # imported as simulations.* would share entries with script runs that
+        # cannot rebuild them. Compile in memory when imported as a package.
+        _njit, _vectorize = njit, vectorize
+
+        def njit(*args, **kwargs):
+            return _njit(*args, **{**kwargs, "cache": False})
+
+        def vectorize(*args, **kwargs):
+            return _vectorize(*args, **{**kwargs, "cache": False})
+
+__all__ = ["njit", "prange", "vectorize"]
@@ -1,59 +1,94 @@
 #!/usr/bin/env python3
 """Fermi Energy Calculator for Metallic Systems"""
+import math
+import sys
+
 import numpy as np
 
+try:
+    from ._numba_compat import njit
+except ImportError:  # run as a script from simulations/
+    from _numba_compat import njit
+
 # Constants
 hbar = 1.055e-34   # Reduced Planck constant (J·s)
 m_e = 9.109e-31    # Electron mass (kg)
 eV = 1.602e-19     # Electron-volt (J)
 k_B = 1.381e-23    # Boltzmann constant (J/K)
 
-# Free electron densities (electrons/m^3)
-metals = {
-    "Na": {"n": 2.65e28, "valence": 1, "desc": "Alkali metal"},
-    "Cu": {"n": 8.49e28, "valence": 1, "desc": "Noble metal (coin/wire)"},
-    "Al": {"n": 18.1e28, "valence": 3, "desc": "Trivalent, lightweight"},
-    "Au": {"n": 5.90e28, "valence": 1, "desc": "Noble metal (contacts)"},
-    "Ag": {"n": 5.86e28, "valence": 1, "desc": "Highest conductivity"},
-    "Fe": {"n": 17.0e28, "valence": 2, "desc": "Structural/magnetic"},
-}
-
-print("Fermi Energy Analysis for Metallic Wearable Components")
-print("=" * 70)
-print(f"E_F = (hbar^2 / 2m) * (3*pi^2 * n)^(2/3)")
-print()
-print(f"{'Metal':<6} {'n(10^28/m3)':<14} {'E_F(eV)':<10} {'T_F(K)':<12} {'v_F(m/s)':<12} {'Notes'}")
-print("-" * 70)
-
-for name, m in metals.items():
-    n = m["n"]
-    E_F = (hbar**2 / (2 * m_e)) * (3 * np.pi**2 * n)**(2/3)
-    E_F_eV = E_F / eV
-    T_F = E_F / k_B
+# Free electron densities (electrons/m^3), one entry per metal
+names    = ["Na", "Cu", "Al", "Au", "Ag", "Fe"]
+n_arr    = np.array([2.65e28, 8.49e28, 18.1e28, 5.90e28, 5.86e28, 17.0e28])
+valences = np.array([1, 1, 3, 1, 1, 2])
+descs    = ["Alkali metal", "Noble metal (coin/wire)", "Trivalent, lightweight",
+            "Noble metal (contacts)", "Highest conductivity", "Structural/magnetic"]
+
+# Derived constants as plain Python floats
+PI2 = math.pi * math.pi
+HBAR2_OVER_2M = hbar * hbar / (2.0 * m_e)
+THREE_PI2 = 3.0 * PI2
+
+
+@njit(cache=True)
+def fermi_kernel(n, T):
+    """E_F, v_F and the Sommerfeld correction for every (T, metal) pair."""
+    E_F = HBAR2_OVER_2M * (THREE_PI2 * n)**(2/3)
     v_F = np.sqrt(2 * E_F / m_e)
-    print(f"{name:<6} {n/1e28:<14.2f} {E_F_eV:<10.2f} {T_F:<12.0f} {v_F:<12.0f} {m['desc']}")
-
-print()
-print("Temperature dependence of electron energy:")
-temps = [4, 77, 300, 310, 500]
-print(f"{'T(K)':<8}", end="")
-for name in metals:
-    print(f"{name:<10}", end="")
-print()
-print("-" * 68)
-
-for T in temps:
-    print(f"{T:<8}", end="")
-    for name, m in metals.items():
-        n = m["n"]
-        E_F = (hbar**2 / (2 * m_e)) * (3 * np.pi**2 * n)**(2/3)
-        correction = 1 - (np.pi**2 / 12) * (k_B * T / E_F)**2
-        print(f"{E_F/eV*correction:<10.4f}", end="")
-    print()
-
-print()
-print("Wearable relevance:")
-print(f"  Body temp (310K) << T_F (~50000K) for all metals")
-print(f"  Electrons remain deeply degenerate at body temperature")
-print(f"  Fermi-Dirac statistics essential, classical Boltzmann fails")
-print(f"  Conductivity of wearable contacts determined by E_F and scattering")
+    # E_F depends only on the metal, so cache k_B/E_F once per column
+    ratio_base = k_B / E_F
+    corr = 1 - (PI2 / 12) * (T.reshape(-1, 1) * ratio_base.reshape(1, -1))**2
+    return E_F, v_F, corr
+
+
+def compute(temps=(4, 77, 300, 310, 500)):
+    """Fermi energies for the metals table and their values at each of ``temps``."""
+    E_F, v_F, corr = fermi_kernel(n_arr, np.array(temps, dtype=np.float64))
+    E_F_eV = E_F / eV
+    return {
+        "E_F": E_F,
+        "E_F_eV": E_F_eV,
+        "T_F": E_F / k_B,
+        "v_F": v_F,
+        "corr": corr,
+        "E_T_eV": E_F_eV[None, :] * corr,
+    }
+
+
+def main():
+    temps = (4, 77, 300, 310, 500)
+    res = compute(temps)
+    E_F_eV, T_F, v_F = res["E_F_eV"], res["T_F"], res["v_F"]
+
+    out = []
+    out.append("Fermi Energy Analysis for Metallic Wearable Components")
+    out.append("=" * 70)
+    out.append(f"E_F = (hbar^2 / 2m) * (3*pi^2 * n)^(2/3)")
+    out.append("")
+    out.append(f"{'Metal':<6} {'n(10^28/m3)':<14} {'E_F(eV)':<10} {'T_F(K)':<12} {'v_F(m/s)':<12} {'Notes'}")
+    out.append("-" * 70)
+
+    for i, name in enumerate(names):
+        out.append(f"{name:<6} {n_arr[i]/1e28:<14.2f} {E_F_eV[i]:<10.2f} {T_F[i]:<12.0f} {v_F[i]:<12.0f} {descs[i]}")
+
+    out.append("")
+    out.append("Temperature dependence of electron energy:")
+    out.append(f"{'T(K)':<8}" + "".join(f"{name:<10}" for name in names))
+    out.append("-" * 68)
+
+    row_fmt = "{:<8}".format
+    val_fmt = "{:<10.4f}".format
+    for t, row in zip(temps, res["E_T_eV"]):
+        out.append(row_fmt(t) + "".join(map(val_fmt, row)))
+
+    out.append("")
+    out.append("Wearable relevance:")
+    out.append(f"  Body temp (310K) << T_F (~50000K) for all metals")
+    out.append(f"  Electrons remain deeply degenerate at body temperature")
+    out.append(f"  Fermi-Dirac statistics essential, classical Boltzmann fails")
+    out.append(f"  Conductivity of wearable contacts determined by E_F and scattering")
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,68 +1,115 @@
 #!/usr/bin/env python3
 """Nernst-Planck Ion Flux Simulator for Wearable Ion Systems"""
+import sys
+
 import numpy as np
 
+try:
+    from ._numba_compat import njit
+except ImportError:  # run as a script from simulations/
+    from _numba_compat import njit
+
 # Constants
 F = 96485      # Faraday constant (C/mol)
 R = 8.314      # Gas constant (J/mol·K)
 T = 310        # Body temperature (K)
 kT = R * T     # Thermal energy
 
-# Ion properties
-ions = {
-    "Na+": {"z": 1, "D": 1.33e-9, "C_in": 12e-3, "C_out": 145e-3},
-    "K+":  {"z": 1, "D": 1.96e-9, "C_in": 140e-3, "C_out": 4e-3},
-    "Ca2+":{"z": 2, "D": 0.79e-9, "C_in": 0.1e-6, "C_out": 2.5e-3},
-    "Cl-": {"z":-1, "D": 2.03e-9, "C_in": 4e-3, "C_out": 110e-3},
-}
-
-print("Nernst-Planck Ion Flux Analysis")
-print("=" * 65)
-print(f"Temperature: {T}K (body temp)")
-print()
-
-# Nernst potential for each ion
-print(f"{'Ion':<8} {'z':<4} {'C_in(mM)':<12} {'C_out(mM)':<12} {'E_nernst(mV)':<14} {'Direction'}")
-print("-" * 65)
-
-for name, ion in ions.items():
-    z = ion["z"]
-    E_nernst = (R * T / (z * F)) * np.log(ion["C_out"] / ion["C_in"])
-    E_mV = E_nernst * 1000
-    direction = "inward" if (z > 0 and E_mV > 0) or (z < 0 and E_mV < 0) else "outward"
-    print(f"{name:<8} {z:<4} {ion['C_in']*1e3:<12.2f} {ion['C_out']*1e3:<12.1f} {E_mV:<14.1f} {direction}")
-
-# Fick's diffusion flux (no field)
-print()
-print("Diffusion Flux (Fick's Law, no electric field)")
-print("J = -D * dC/dx")
-print("-" * 65)
-dx = 10e-9  # membrane thickness ~10nm
-
-for name, ion in ions.items():
-    dC = ion["C_out"] - ion["C_in"]
-    J = -ion["D"] * (dC / dx)
-    print(f"{name:<8} D={ion['D']:.2e} m^2/s  dC/dx={dC/dx:.2e}  J={J:.2e} mol/(m^2·s)")
-
-# Full Nernst-Planck with membrane potential
-V_m = -0.070  # resting membrane potential -70mV
-print()
-print(f"Full Nernst-Planck flux at V_m = {V_m*1000:.0f} mV")
-print("J = -D(dC/dx + zFC/RT * dV/dx)")
-print("-" * 65)
-
-for name, ion in ions.items():
-    z = ion["z"]
-    C_avg = (ion["C_in"] + ion["C_out"]) / 2
-    dC = ion["C_out"] - ion["C_in"]
-    J_diff = -ion["D"] * dC / dx
-    J_migr = -ion["D"] * z * F * C_avg / (R * T) * (V_m / dx)
+# Ion properties (parallel arrays, one entry per ion)
+ion_names = ["Na+", "K+", "Ca2+", "Cl-"]
+z = np.array([1, 1, 2, -1])
+D = np.array([1.33e-9, 1.96e-9, 0.79e-9, 2.03e-9])
+C_in = np.array([12e-3, 140e-3, 0.1e-6, 4e-3])
+C_out = np.array([145e-3, 4e-3, 2.5e-3, 110e-3])
+
+dx = 10e-9     # membrane thickness ~10nm
+V_m = -0.070   # resting membrane potential -70mV
+
+
+@njit(cache=True)
+def compute_fluxes(z, D, Cin, Cout, dx, V_m, F, R, T):
+    """Nernst potential and Nernst-Planck flux components for each ion."""
+    E_nernst = (R * T / (z * F)) * np.log(Cout / Cin)
+    C_avg = (Cin + Cout) / 2
+    dC = Cout - Cin
+    J_diff = -D * dC / dx
+    J_migr = -D * z * F * C_avg / (R * T) * (V_m / dx)
     J_total = J_diff + J_migr
-    print(f"{name:<8} J_diff={J_diff:+.2e}  J_migr={J_migr:+.2e}  J_total={J_total:+.2e}")
-
-print()
-print("Key insights:")
-print("  - K+ has outward diffusion gradient but inward electrical drive")
-print("  - Na+ has both inward diffusion AND electrical drive (strong inward)")
-print("  - Ca2+ has massive concentration gradient (25000:1 out:in)")
-print("  - At resting potential, net fluxes are maintained by Na/K ATPase")
+    return E_nernst, J_diff, J_migr, J_total
+
+
+@njit(cache=True)
+def compute_fluxes_sweep(z, D, Cin, Cout, dx, V_ms, F, R, T):
+    """compute_fluxes over many potentials; J_migr and J_total are (len(V_ms), n_ion)."""
+    E_nernst, J_diff, _, _ = compute_fluxes(z, D, Cin, Cout, dx, 0.0, F, R, T)
+    J_migr = np.empty((V_ms.shape[0], z.shape[0]))
+    J_total = np.empty((V_ms.shape[0], z.shape[0]))
+    for k in range(V_ms.shape[0]):
+        _, _, J_migr[k], J_total[k] = compute_fluxes(z, D, Cin, Cout, dx, V_ms[k], F, R, T)
+    return E_nernst, J_diff, J_migr, J_total
+
+
+def compute(V_m=V_m):
+    """Nernst potentials and flux components for the ion table at ``V_m`` (scalar or array)."""
+    if np.ndim(V_m):
+        V_ms = np.asarray(V_m, dtype=np.float64)
+        E_nernst, J_diff, J_migr, J_total = compute_fluxes_sweep(z, D, C_in, C_out, dx, V_ms, F, R, T)
+    else:
+        E_nernst, J_diff, J_migr, J_total = compute_fluxes(z, D, C_in, C_out, dx, V_m, F, R, T)
+    return {
+        "E_nernst": E_nernst,
+        "J_diff": J_diff,
+        "J_migr": J_migr,
+        "J_total": J_total,
+        "direction": np.where(z * E_nernst > 0, "inward", "outward"),
+    }
+
+
+def main():
+    res = compute(V_m)
+    E_nernst, J_diff, J_migr, J_total = res["E_nernst"], res["J_diff"], res["J_migr"], res["J_total"]
+    direction = res["direction"]
+
+    out = []
+    out.append("Nernst-Planck Ion Flux Analysis")
+    out.append("=" * 65)
+    out.append(f"Temperature: {T}K (body temp)")
+    out.append("")
+
+    # Nernst potential for each ion
+    out.append(f"{'Ion':<8} {'z':<4} {'C_in(mM)':<12} {'C_out(mM)':<12} {'E_nernst(mV)':<14} {'Direction'}")
+    out.append("-" * 65)
+
+    for i, name in enumerate(ion_names):
+        out.append(f"{name:<8} {z[i]:<4} {C_in[i]*1e3:<12.2f} {C_out[i]*1e3:<12.1f} {E_nernst[i]*1000:<14.1f} {direction[i]}")
+
+    # Fick's diffusion flux (no field)
+    out.append("")
+    out.append("Diffusion Flux (Fick's Law, no electric field)")
+    out.append("J = -D * dC/dx")
+    out.append("-" * 65)
+    for i, name in enumerate(ion_names):
+        dC = C_out[i] - C_in[i]
+        out.append(f"{name:<8} D={D[i]:.2e} m^2/s  dC/dx={dC/dx:.2e}  J={J_diff[i]:.2e} mol/(m^2·s)")
+
+    # Full Nernst-Planck with membrane potential
+    out.append("")
+    out.append(f"Full Nernst-Planck flux at V_m = {V_m*1000:.0f} mV")
+    out.append("J = -D(dC/dx + zFC/RT * dV/dx)")
+    out.append("-" * 65)
+
+    for i, name in enumerate(ion_names):
+        out.append(f"{name:<8} J_diff={J_diff[i]:+.2e}  J_migr={J_migr[i]:+.2e}  J_total={J_total[i]:+.2e}")
+
+    out.append("")
+    out.append("Key insights:")
+    out.append("  - K+ has outward diffusion gradient but inward electrical drive")
+    out.append("  - Na+ has both inward diffusion AND electrical drive (strong inward)")
+    out.append("  - Ca2+ has massive concentration gradient (25000:1 out:in)")
+    out.append("  - At resting potential, net fluxes are maintained by Na/K ATPase")
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+if __name__ == "__main__":
+    main()
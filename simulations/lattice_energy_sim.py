@@ -1,7 +1,14 @@
 #!/usr/bin/env python3
 """Born-Lande Lattice Energy Calculator"""
+import sys
+
 import numpy as np
 
+try:
+    from ._numba_compat import njit
+except ImportError:  # run as a script from simulations/
+    from _numba_compat import njit
+
 # Constants
 N_A = 6.022e23     # Avogadro's number
 e = 1.602e-19      # Elementary charge (C)
@@ -10,52 +17,88 @@ pi = np.pi
 eV = 1.602e-19
 
 # Crystal data: Madelung constant, Born exponent, charges, r0 (pm)
-crystals = {
-    "NaCl": {"M": 1.7476, "n": 8, "z+": 1, "z-": 1, "r0": 281, "struct": "Rock salt"},
-    "CsCl": {"M": 1.7627, "n": 10.5, "z+": 1, "z-": 1, "r0": 356, "struct": "CsCl-type"},
-    "ZnS":  {"M": 1.6381, "n": 9, "z+": 2, "z-": 2, "r0": 235, "struct": "Zinc blende"},
-    "MgO":  {"M": 1.7476, "n": 7, "z+": 2, "z-": 2, "r0": 210, "struct": "Rock salt"},
-    "CaF2": {"M": 2.5194, "n": 8, "z+": 2, "z-": 1, "r0": 237, "struct": "Fluorite"},
-    "TiO2": {"M": 2.408,  "n": 9, "z+": 4, "z-": 2, "r0": 196, "struct": "Rutile"},
-}
-
-print("Born-Lande Lattice Energy Analysis")
-print("=" * 75)
-print("U = -(N_A * M * z+ * z- * e^2) / (4*pi*eps0*r0) * (1 - 1/n)")
-print()
-print(f"{'Crystal':<8} {'Struct':<12} {'M':<8} {'z+z-':<6} {'r0(pm)':<8} {'n':<6} {'U(kJ/mol)':<12} {'U(eV/pair)'}")
-print("-" * 75)
-
-for name, c in crystals.items():
-    r0_m = c["r0"] * 1e-12
-    U = -(N_A * c["M"] * c["z+"] * c["z-"] * e**2) / (4 * pi * eps0 * r0_m) * (1 - 1/c["n"])
-    U_kJ = U / 1000
-    U_eV = U / (N_A * eV)
-    print(f"{name:<8} {c['struct']:<12} {c['M']:<8.4f} {c['z+']*c['z-']:<6} {c['r0']:<8} {c['n']:<6} {U_kJ:<12.0f} {U_eV:<8.2f}")
-
-# Energy vs spacing plot data (NaCl)
-print()
-print("NaCl Energy vs Spacing (for plotting)")
-print("-" * 50)
+names   = ["NaCl", "CsCl", "ZnS", "MgO", "CaF2", "TiO2"]
+M       = np.array([1.7476, 1.7627, 1.6381, 1.7476, 2.5194, 2.408])
+n       = np.array([8, 10.5, 9, 7, 8, 9])
+z_plus  = np.array([1, 1, 2, 2, 2, 4])
+z_minus = np.array([1, 1, 2, 2, 1, 2])
+r0_pm   = np.array([281, 356, 235, 210, 237, 196])
+struct  = ["Rock salt", "CsCl-type", "Zinc blende", "Rock salt", "Fluorite", "Rutile"]
+
+K = e**2 / (4 * pi * eps0)  # Coulomb prefactor (J·m)
+PREFACTOR = -N_A * K        # Born-Lande prefactor per mole (J·m/mol)
+
+# NaCl reference for the energy-vs-spacing curve
 M_nacl = 1.7476
 n_nacl = 8
 # Determine B from equilibrium: B = (N_A*M*z*z*e^2)/(4*pi*eps0) * r0^(n-1) / n
 r0_nacl = 281e-12
-A_coeff = (N_A * M_nacl * 1 * 1 * e**2) / (4 * pi * eps0)
+A_coeff = N_A * M_nacl * 1 * 1 * K
 B = A_coeff * r0_nacl**(n_nacl - 1) / n_nacl
 
-r_range = np.linspace(200e-12, 500e-12, 30)
-print(f"{'r(pm)':<10} {'U_attract(kJ)':<16} {'U_repel(kJ)':<16} {'U_total(kJ)'}")
-for r in r_range:
+
+@njit(cache=True)
+def born_lande(M, n, z_plus, z_minus, r0_m):
+    """Born-Lande lattice energy (J/mol) for each crystal."""
+    return PREFACTOR * M * (z_plus * z_minus) / r0_m * (1 - 1.0/n)
+
+
+@njit(cache=True)
+def nacl_curve(r):
+    """Attractive and repulsive NaCl lattice energy (kJ/mol) at spacings ``r``."""
     U_att = -A_coeff / r / 1000
     U_rep = B / r**n_nacl / 1000
-    U_tot = (U_att + U_rep)
-    print(f"{r*1e12:<10.0f} {U_att:<16.1f} {U_rep:<16.1f} {U_tot:<12.1f}")
-
-print()
-print("Wearable material insights:")
-print("  - NaCl: Reference ionic compound, dissolves in sweat")
-print("  - MgO: Ultra-stable, potential substrate for wearable sensors")
-print("  - TiO2: Biocompatible, used in wearable UV sensors")
-print("  - ZnS: Electroluminescent, used in flexible displays")
-print("  - Higher lattice energy = more stable = harder to dissolve")
+    return U_att, U_rep
+
+
+def compute(r_min=200e-12, r_max=500e-12, n_points=30):
+    """Lattice energies for the crystal table and the NaCl spacing sweep."""
+    U = born_lande(M, n, z_plus, z_minus, r0_pm * 1e-12)
+    r_range = np.linspace(r_min, r_max, n_points)
+    U_att, U_rep = nacl_curve(r_range)
+    return {
+        "U_kJ": U / 1000,
+        "U_eV": U / (N_A * eV),
+        "r_range": r_range,
+        "U_att": U_att,
+        "U_rep": U_rep,
+        "U_tot": U_att + U_rep,
+    }
+
+
+def main():
+    res = compute()
+    U_kJ, U_eV = res["U_kJ"], res["U_eV"]
+
+    out = []
+    out.append("Born-Lande Lattice Energy Analysis")
+    out.append("=" * 75)
+    out.append("U = -(N_A * M * z+ * z- * e^2) / (4*pi*eps0*r0) * (1 - 1/n)")
+    out.append("")
+    out.append(f"{'Crystal':<8} {'Struct':<12} {'M':<8} {'z+z-':<6} {'r0(pm)':<8} {'n':<6} {'U(kJ/mol)':<12} {'U(eV/pair)'}")
+    out.append("-" * 75)
+
+    for i, name in enumerate(names):
+        out.append(f"{name:<8} {struct[i]:<12} {M[i]:<8.4f} {z_plus[i]*z_minus[i]:<6} {r0_pm[i]:<8} {n[i]:<6g} {U_kJ[i]:<12.0f} {U_eV[i]:<8.2f}")
+
+    # Energy vs spacing plot data (NaCl)
+    out.append("")
+    out.append("NaCl Energy vs Spacing (for plotting)")
+    out.append("-" * 50)
+    out.append(f"{'r(pm)':<10} {'U_attract(kJ)':<16} {'U_repel(kJ)':<16} {'U_total(kJ)'}")
+    for r, ua, ur, ut in zip(res["r_range"], res["U_att"], res["U_rep"], res["U_tot"]):
+        out.append(f"{r*1e12:<10.0f} {ua:<16.1f} {ur:<16.1f} {ut:<12.1f}")
+
+    out.append("")
+    out.append("Wearable material insights:")
+    out.append("  - NaCl: Reference ionic compound, dissolves in sweat")
+    out.append("  - MgO: Ultra-stable, potential substrate for wearable sensors")
+    out.append("  - TiO2: Biocompatible, used in wearable UV sensors")
+    out.append("  - ZnS: Electroluminescent, used in flexible displays")
+    out.append("  - Higher lattice energy = more stable = harder to dissolve")
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,9 @@ C13B0 Structural Engine — Module A
 Connects electrostatics, magnetostatics, and wave propagation.
 Shows how ion currents generate fields and fields propagate as waves.
 """
+import math
+import sys
+
 import numpy as np
 
 # Constants
@@ -14,134 +17,167 @@ mu0 = 4 * np.pi * 1e-7  # Permeability of free space (H/m)
 c = 1 / np.sqrt(eps0 * mu0)  # Speed of light (m/s)
 e = 1.602e-19       # Elementary charge (C)
 k_B = 1.381e-23     # Boltzmann constant (J/K)
-
-print("Maxwell Field Simulation — Unified EM Analysis")
-print("=" * 70)
-
-# ─── PART 1: Gauss's Law — Charge → Field ───
-print("\n─── PART 1: Gauss's Law (∇·E = ρ/ε₀) ───")
-print("Point charge electric field vs distance\n")
-
-charges = {
-    "Na+":  {"q":  1*e, "desc": "Sodium ion"},
-    "Ca2+": {"q":  2*e, "desc": "Calcium ion"},
-    "Cl-":  {"q": -1*e, "desc": "Chloride ion"},
-    "Al3+": {"q":  3*e, "desc": "Aluminum ion"},
-}
-
-print(f"{'Ion':<8} {'q(e)':<8} {'E at 1nm (V/m)':<18} {'E at 10nm':<18} {'E at 1um':<16}")
-print("-" * 70)
-
-for name, ch in charges.items():
-    q = ch["q"]
-    for_display = []
-    for r in [1e-9, 10e-9, 1e-6]:
-        E = abs(q) / (4 * np.pi * eps0 * r**2)
-        for_display.append(E)
-    print(f"{name:<8} {q/e:<+8.0f} {for_display[0]:<18.3e} {for_display[1]:<18.3e} {for_display[2]:<16.3e}")
-
-# ─── PART 2: Ampere's Law — Current → Magnetic Field ───
-print("\n─── PART 2: Ampère's Law (∇×B = μ₀J + μ₀ε₀∂E/∂t) ───")
-print("Ion current in a nerve fiber → magnetic field\n")
-
-# Typical nerve parameters
-nerve_currents = {
-    "Resting leak":    {"I": 1e-12,  "desc": "Single channel (~1 pA)"},
-    "Single channel":  {"I": 5e-12,  "desc": "Open Na+ channel"},
-    "Action potential": {"I": 1e-9,  "desc": "Net membrane current"},
-    "Nerve bundle":    {"I": 1e-6,   "desc": "Whole nerve (~1 μA)"},
-    "Cardiac":         {"I": 1e-3,   "desc": "Heart muscle (~1 mA)"},
-}
-
-print(f"{'Source':<20} {'I':<12} {'B at 1mm (T)':<16} {'B at 1cm':<16} {'Detectable?'}")
-print("-" * 70)
-
-for name, nc in nerve_currents.items():
-    I = nc["I"]
-    B_1mm = mu0 * I / (2 * np.pi * 1e-3)
-    B_1cm = mu0 * I / (2 * np.pi * 1e-2)
+COULOMB_K = 1.0 / (4.0 * math.pi * eps0)  # Coulomb constant (N·m²/C²)
+
+# Display unit tables; bin i covers (edges[i-1], edges[i]]
+LAM_EDGES = np.array([1e-6, 1e-3, 1])
+LAM_SCALES = np.array([1e9, 1e6, 1e3, 1])
+LAM_SUFFIXES = np.array(["nm", "μm", "mm", "m"])
+LAM_DECIMALS = np.array([0, 1, 1, 1])
+POWER_EDGES = np.array([1e-9, 1e-6, 1e-3])
+POWER_SCALES = np.array([1e9, 1e6, 1e3, 1])
+POWER_SUFFIXES = np.array(["nW", "μW", "mW", "W"])
+
+# PART 1: point charges and field distances
+ion_names = ["Na+", "Ca2+", "Cl-", "Al3+"]
+q = np.array([1, 2, -1, 3]) * e
+ion_descs = ["Sodium ion", "Calcium ion", "Chloride ion", "Aluminum ion"]
+r = np.array([1e-9, 10e-9, 1e-6])
+
+# PART 2: typical nerve parameters
+source_names = ["Resting leak", "Single channel", "Action potential", "Nerve bundle", "Cardiac"]
+I = np.array([1e-12, 5e-12, 1e-9, 1e-6, 1e-3])
+source_descs = ["Single channel (~1 pA)", "Open Na+ channel", "Net membrane current",
+                "Whole nerve (~1 μA)", "Heart muscle (~1 mA)"]
+d = np.array([1e-3, 1e-2])
+
+# PART 3: EMF = -dΦ/dt = -A * dB/dt
+coil_names = ["Wearable coil (1cm²)", "Watch coil (4cm²)", "Chest patch (100cm²)"]
+A_coil = np.array([1e-4, 4e-4, 100e-4])
+dBdt_names = ["Slow (1 T/s)", "RF (1kHz, 1mT)", "NFC (13.56MHz, 10μT)"]
+dBdt = np.array([1, 2*np.pi*1e3*1e-3, 2*np.pi*13.56e6*10e-6])
+
+# PART 4: EM spectrum relevant to wearable tech
+band_names = ["DC (battery)", "ELF (nerve)", "RF (BLE)", "NFC",
+              "Sub-GHz (LoRa)", "WiFi", "IR (body heat)", "Visible (display)"]
+f_band = np.array([0, 1e3, 2.4e9, 13.56e6, 868e6, 5.8e9, 3e13, 5e14])
+band_uses = ["Power storage", "Neural signals", "Bluetooth Low Energy", "Payment/ID",
+             "Long-range IoT", "Data transfer", "Thermal emission", "LED/OLED display"]
+
+# PART 5: field energy scenarios
+scenario_names = ["Nerve membrane (10⁷ V/m)", "Cell phone antenna", "MRI scanner (3T)",
+                  "Earth surface", "Lightning (nearby)"]
+E_field = np.array([1e7, 1, 0, 100, 3e6])
+B_field = np.array([0, 3.3e-9, 3, 50e-6, 1e-4])
+
+
+def compute():
+    """Field tables for PARTs 1-3 and 5 as arrays indexed like the data above."""
+    E = COULOMB_K * np.abs(q)[:, None] / r[None, :]**2
+
+    B = mu0 * I[:, None] / (2 * np.pi * d[None, :])
     # Earth's field ~50 μT, MEG detects ~100 fT
-    detectable = "MEG" if B_1cm > 1e-13 else "SQUID only" if B_1cm > 1e-15 else "Below noise"
-    print(f"{name:<20} {I:<12.1e} {B_1mm:<16.2e} {B_1cm:<16.2e} {detectable}")
-
-# ─── PART 3: Faraday's Law — Changing B → E ───
-print("\n─── PART 3: Faraday's Law (∇×E = -∂B/∂t) ───")
-print("Induction from changing magnetic fields\n")
-
-# EMF = -dΦ/dt = -A * dB/dt
-areas = {"Wearable coil (1cm²)": 1e-4, "Watch coil (4cm²)": 4e-4, "Chest patch (100cm²)": 100e-4}
-dBdt_values = {"Slow (1 T/s)": 1, "RF (1kHz, 1mT)": 2*np.pi*1e3*1e-3, "NFC (13.56MHz, 10μT)": 2*np.pi*13.56e6*10e-6}
-
-print(f"{'Coil':<24} {'dB/dt source':<24} {'EMF (V)':<14} {'Power @ 1kΩ'}")
-print("-" * 70)
-for aname, A in areas.items():
-    for dname, dBdt in dBdt_values.items():
-        emf = A * dBdt
-        P = emf**2 / 1000  # Power into 1kΩ load
-        unit = "W" if P > 1e-3 else "mW" if P > 1e-6 else "μW" if P > 1e-9 else "nW"
-        pval = P * (1 if P > 1e-3 else 1e3 if P > 1e-6 else 1e6 if P > 1e-9 else 1e9)
-        print(f"{aname:<24} {dname:<24} {emf:<14.4e} {pval:.2f} {unit}")
-
-# ─── PART 4: Wave Equation — Fields Propagate ───
-print("\n─── PART 4: Wave Propagation (c = 1/√(μ₀ε₀)) ───")
-print(f"Speed of light: c = {c:.6e} m/s\n")
-
-# EM spectrum relevant to wearable tech
-spectrum = {
-    "DC (battery)":      {"f": 0,        "use": "Power storage"},
-    "ELF (nerve)":       {"f": 1e3,      "use": "Neural signals"},
-    "RF (BLE)":          {"f": 2.4e9,    "use": "Bluetooth Low Energy"},
-    "NFC":               {"f": 13.56e6,  "use": "Payment/ID"},
-    "Sub-GHz (LoRa)":    {"f": 868e6,    "use": "Long-range IoT"},
-    "WiFi":              {"f": 5.8e9,    "use": "Data transfer"},
-    "IR (body heat)":    {"f": 3e13,     "use": "Thermal emission"},
-    "Visible (display)": {"f": 5e14,     "use": "LED/OLED display"},
-}
-
-print(f"{'Band':<20} {'Freq':<14} {'λ':<14} {'Wearable use'}")
-print("-" * 70)
-for name, s in spectrum.items():
-    f = s["f"]
-    if f > 0:
-        lam = c / f
-        if lam > 1: lam_s = f"{lam:.1f} m"
-        elif lam > 1e-3: lam_s = f"{lam*1e3:.1f} mm"
-        elif lam > 1e-6: lam_s = f"{lam*1e6:.1f} μm"
-        else: lam_s = f"{lam*1e9:.0f} nm"
-    else:
-        lam_s = "∞"
-    print(f"{name:<20} {f:<14.2e} {lam_s:<14} {s['use']}")
-
-# ─── PART 5: Energy in Fields ───
-print("\n─── PART 5: Field Energy Density ───")
-print("u_E = ½ε₀E²  |  u_B = B²/(2μ₀)\n")
-
-scenarios = {
-    "Nerve membrane (10⁷ V/m)": {"E": 1e7, "B": 0},
-    "Cell phone antenna":        {"E": 1,   "B": 3.3e-9},
-    "MRI scanner (3T)":          {"E": 0,   "B": 3},
-    "Earth surface":             {"E": 100, "B": 50e-6},
-    "Lightning (nearby)":        {"E": 3e6, "B": 1e-4},
-}
-
-print(f"{'Scenario':<30} {'u_E (J/m³)':<16} {'u_B (J/m³)':<16} {'Dominant'}")
-print("-" * 70)
-for name, s in scenarios.items():
-    u_E = 0.5 * eps0 * s["E"]**2
-    u_B = s["B"]**2 / (2 * mu0)
-    dominant = "Electric" if u_E > u_B else "Magnetic" if u_B > u_E else "Equal"
-    print(f"{name:<30} {u_E:<16.3e} {u_B:<16.3e} {dominant}")
-
-# ─── PART 6: Maxwell Unification Summary ───
-print("\n─── MAXWELL UNIFICATION ───")
-print("┌─────────────────────────────────────────────────────────┐")
-print("│  ∇·E = ρ/ε₀           Charge → Electric field          │")
-print("│  ∇·B = 0               No magnetic monopoles            │")
-print("│  ∇×E = -∂B/∂t          Changing B → Electric field      │")
-print("│  ∇×B = μ₀J + μ₀ε₀∂E/∂t  Current + changing E → B      │")
-print("├─────────────────────────────────────────────────────────┤")
-print("│  Ions create ρ → E field (Gauss)                        │")
-print("│  Moving ions = J → B field (Ampère)                     │")
-print("│  Changing fields → waves at c (Faraday + Ampère)        │")
-print("│  Everything links back to charge and its motion.        │")
-print("└─────────────────────────────────────────────────────────┘")
+    B_1cm = B[:, 1]
+    detectable = np.select([B_1cm > 1e-13, B_1cm > 1e-15], ["MEG", "SQUID only"], default="Below noise")
+
+    EMF = A_coil[:, None] * dBdt[None, :]
+    P_load = EMF**2 / 1000  # Power into 1kΩ load
+    P_idx = np.digitize(P_load, POWER_EDGES, right=True)
+
+    # DC has no finite wavelength; divide by 1 there and mask to inf
+    lam = np.where(f_band > 0, c / np.where(f_band > 0, f_band, 1), np.inf)
+    lam_idx = np.searchsorted(LAM_EDGES, lam)
+
+    u_E = 0.5 * eps0 * E_field**2
+    u_B = B_field**2 / (2 * mu0)
+    dominant = np.select([u_E > u_B, u_B > u_E], ["Electric", "Magnetic"], default="Equal")
+
+    return {
+        "E": E,
+        "B": B,
+        "detectable": detectable,
+        "EMF": EMF,
+        "P_load": P_load,
+        "P_val": P_load * POWER_SCALES[P_idx],
+        "P_unit": POWER_SUFFIXES[P_idx],
+        "lam": lam,
+        "lam_val": lam * LAM_SCALES[lam_idx],
+        "lam_unit": LAM_SUFFIXES[lam_idx],
+        "lam_decimals": LAM_DECIMALS[lam_idx],
+        "u_E": u_E,
+        "u_B": u_B,
+        "dominant": dominant,
+    }
+
+
+def main():
+    res = compute()
+
+    out = []
+    out.append("Maxwell Field Simulation — Unified EM Analysis")
+    out.append("=" * 70)
+
+    # ─── PART 1: Gauss's Law — Charge → Field ───
+    out.append("\n─── PART 1: Gauss's Law (∇·E = ρ/ε₀) ───")
+    out.append("Point charge electric field vs distance\n")
+
+    out.append(f"{'Ion':<8} {'q(e)':<8} {'E at 1nm (V/m)':<18} {'E at 10nm':<18} {'E at 1um':<16}")
+    out.append("-" * 70)
+
+    E = res["E"]
+    for i, name in enumerate(ion_names):
+        out.append(f"{name:<8} {q[i]/e:<+8.0f} {E[i, 0]:<18.3e} {E[i, 1]:<18.3e} {E[i, 2]:<16.3e}")
+
+    # ─── PART 2: Ampere's Law — Current → Magnetic Field ───
+    out.append("\n─── PART 2: Ampère's Law (∇×B = μ₀J + μ₀ε₀∂E/∂t) ───")
+    out.append("Ion current in a nerve fiber → magnetic field\n")
+
+    out.append(f"{'Source':<20} {'I':<12} {'B at 1mm (T)':<16} {'B at 1cm':<16} {'Detectable?'}")
+    out.append("-" * 70)
+
+    for i, name in enumerate(source_names):
+        B_1mm, B_1cm = res["B"][i]
+        out.append(f"{name:<20} {I[i]:<12.1e} {B_1mm:<16.2e} {B_1cm:<16.2e} {res['detectable'][i]}")
+
+    # ─── PART 3: Faraday's Law — Changing B → E ───
+    out.append("\n─── PART 3: Faraday's Law (∇×E = -∂B/∂t) ───")
+    out.append("Induction from changing magnetic fields\n")
+
+    out.append(f"{'Coil':<24} {'dB/dt source':<24} {'EMF (V)':<14} {'Power @ 1kΩ'}")
+    out.append("-" * 70)
+    EMF, P_val, P_unit = res["EMF"], res["P_val"], res["P_unit"]
+    for i, aname in enumerate(coil_names):
+        for j, dname in enumerate(dBdt_names):
+            out.append(f"{aname:<24} {dname:<24} {EMF[i, j]:<14.4e} {P_val[i, j]:.2f} {P_unit[i, j]}")
+
+    # ─── PART 4: Wave Equation — Fields Propagate ───
+    out.append("\n─── PART 4: Wave Propagation (c = 1/√(μ₀ε₀)) ───")
+    out.append(f"Speed of light: c = {c:.6e} m/s\n")
+
+    out.append(f"{'Band':<20} {'Freq':<14} {'λ':<14} {'Wearable use'}")
+    out.append("-" * 70)
+    for i, name in enumerate(band_names):
+        if np.isfinite(res["lam"][i]):
+            lam_s = f"{res['lam_val'][i]:.{res['lam_decimals'][i]}f} {res['lam_unit'][i]}"
+        else:
+            lam_s = "∞"
+        out.append(f"{name:<20} {f_band[i]:<14.2e} {lam_s:<14} {band_uses[i]}")
+
+    # ─── PART 5: Energy in Fields ───
+    out.append("\n─── PART 5: Field Energy Density ───")
+    out.append("u_E = ½ε₀E²  |  u_B = B²/(2μ₀)\n")
+
+    out.append(f"{'Scenario':<30} {'u_E (J/m³)':<16} {'u_B (J/m³)':<16} {'Dominant'}")
+    out.append("-" * 70)
+    for i, name in enumerate(scenario_names):
+        out.append(f"{name:<30} {res['u_E'][i]:<16.3e} {res['u_B'][i]:<16.3e} {res['dominant'][i]}")
+
+    # ─── PART 6: Maxwell Unification Summary ───
+    out.append("\n─── MAXWELL UNIFICATION ───")
+    out.append("┌─────────────────────────────────────────────────────────┐")
+    out.append("│  ∇·E = ρ/ε₀           Charge → Electric field          │")
+    out.append("│  ∇·B = 0               No magnetic monopoles            │")
+    out.append("│  ∇×E = -∂B/∂t          Changing B → Electric field      │")
+    out.append("│  ∇×B = μ₀J + μ₀ε₀∂E/∂t  Current + changing E → B      │")
+    out.append("├─────────────────────────────────────────────────────────┤")
+    out.append("│  Ions create ρ → E field (Gauss)                        │")
+    out.append("│  Moving ions = J → B field (Ampère)                     │")
+    out.append("│  Changing fields → waves at c (Faraday + Ampère)        │")
+    out.append("│  Everything links back to charge and its motion.        │")
+    out.append("└─────────────────────────────────────────────────────────┘")
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+if __name__ == "__main__":
+    main()
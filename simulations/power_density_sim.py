@@ -7,64 +7,85 @@ Models power grid optimization across textile substrate.
 Includes IR drop analysis, thermal feedback, and stretch effects.
 Uses Poisson relaxation for voltage distribution.
 """
+import io
+import sys
+
 import numpy as np
 
-print("Power Density Constraint Solver — Textile Power Grid")
-print("=" * 70)
+try:
+    from ._numba_compat import njit, prange
+except ImportError:  # run as a script from simulations/
+    from _numba_compat import njit, prange
+
+try:
+    import scipy.sparse
+    import scipy.sparse.linalg
+except ImportError:  # scipy is optional; fall back to iterative relaxation
+    scipy = None
+
+_buf = io.StringIO()
+
+
+def _p(*args, **kwargs):
+    """print() into the report buffer; written to stdout once at the end."""
+    print(*args, **kwargs, file=_buf)
+
+
+_p("Power Density Constraint Solver — Textile Power Grid")
+_p("=" * 70)
 
 # ─── PART 1: Power Budget Breakdown ───
-print("\n─── PART 1: POWER BUDGET CONSTRAINTS ───\n")
+_p("\n─── PART 1: POWER BUDGET CONSTRAINTS ───\n")
 
 # All power sources and sinks
-sources = {
-    "Thermoelectric (chest)":  {"P_uW": 80,  "V": 0.5, "type": "harvest"},
-    "Thermoelectric (back)":   {"P_uW": 60,  "V": 0.4, "type": "harvest"},
-    "Piezo (shoe L)":          {"P_uW": 25,  "V": 3.0, "type": "harvest"},
-    "Piezo (shoe R)":          {"P_uW": 25,  "V": 3.0, "type": "harvest"},
-    "RF rectenna":             {"P_uW": 5,   "V": 0.3, "type": "harvest"},
-    "Supercap reserve":        {"P_uW": 500, "V": 3.3, "type": "storage"},
-}
-
-sinks = {
-    "MCU (sleep 95%)":         {"P_uW": 4.75,  "V_min": 1.8},
-    "MCU (active 5%)":         {"P_uW": 250,   "V_min": 1.8},
-    "BLE radio (1% duty)":     {"P_uW": 150,   "V_min": 1.8},
-    "Sensors x12 (10% duty)":  {"P_uW": 60,    "V_min": 1.2},
-    "MRAM writes":             {"P_uW": 10,    "V_min": 1.5},
-    "Mesh routing":            {"P_uW": 20,    "V_min": 1.8},
-    "LED (0.1% duty)":         {"P_uW": 20,    "V_min": 2.0},
-}
-
-total_harvest = sum(s["P_uW"] for s in sources.values() if s["type"] == "harvest")
-total_sink_avg = 0
-
-print(f"{'Source':<28} {'Power (μW)':<12} {'Voltage (V)':<12} {'Type'}")
-print("-" * 65)
-for name, s in sources.items():
-    print(f"{name:<28} {s['P_uW']:<12} {s['V']:<12.1f} {s['type']}")
-print(f"\n{'Total harvest:':<28} {total_harvest} μW")
-
-print(f"\n{'Sink':<28} {'Avg P (μW)':<12} {'V_min (V)':<12}")
-print("-" * 55)
-for name, s in sinks.items():
-    total_sink_avg += s["P_uW"]
-    print(f"{name:<28} {s['P_uW']:<12} {s['V_min']:<12.1f}")
-print(f"\n{'Total avg sink:':<28} {total_sink_avg:.1f} μW")
+sources = np.array([
+    ("Thermoelectric (chest)",  80,  0.5, "harvest"),
+    ("Thermoelectric (back)",   60,  0.4, "harvest"),
+    ("Piezo (shoe L)",          25,  3.0, "harvest"),
+    ("Piezo (shoe R)",          25,  3.0, "harvest"),
+    ("RF rectenna",             5,   0.3, "harvest"),
+    ("Supercap reserve",        500, 3.3, "storage"),
+], dtype=[("name", "U28"), ("P_uW", "i8"), ("V", "f8"), ("type", "U8")])
+
+sinks = np.array([
+    ("MCU (sleep 95%)",         4.75, 1.8),
+    ("MCU (active 5%)",         250,  1.8),
+    ("BLE radio (1% duty)",     150,  1.8),
+    ("Sensors x12 (10% duty)",  60,   1.2),
+    ("MRAM writes",             10,   1.5),
+    ("Mesh routing",            20,   1.8),
+    ("LED (0.1% duty)",         20,   2.0),
+], dtype=[("name", "U28"), ("P_uW", "f8"), ("V_min", "f8")])
+
+total_harvest = sources["P_uW"][sources["type"] == "harvest"].sum()
+total_sink_avg = sinks["P_uW"].sum()
+
+_p(f"{'Source':<28} {'Power (μW)':<12} {'Voltage (V)':<12} {'Type'}")
+_p("-" * 65)
+for s in sources:
+    _p(f"{s['name']:<28} {s['P_uW']:<12} {s['V']:<12.1f} {s['type']}")
+_p(f"\n{'Total harvest:':<28} {total_harvest} μW")
+
+_p(f"\n{'Sink':<28} {'Avg P (μW)':<12} {'V_min (V)':<12}")
+_p("-" * 55)
+for s in sinks:
+    _p(f"{s['name']:<28} {s['P_uW']:<12g} {s['V_min']:<12.1f}")
+_p(f"\n{'Total avg sink:':<28} {total_sink_avg:.1f} μW")
 
 margin = total_harvest - total_sink_avg
-print(f"\n{'Power margin:':<28} {margin:.1f} μW {'(OK)' if margin > 0 else '(DEFICIT)'}")
-print(f"{'Duty-averaged surplus:':<28} {margin/total_harvest*100:.1f}%")
+_p(f"\n{'Power margin:':<28} {margin:.1f} μW {'(OK)' if margin > 0 else '(DEFICIT)'}")
+_p(f"{'Duty-averaged surplus:':<28} {margin/total_harvest*100:.1f}%")
 
 # ─── PART 2: IR Drop on Textile Grid ───
-print("\n─── PART 2: IR DROP SIMULATION (TEXTILE POWER MESH) ───")
-print("Solving ∇²V = 0 with source and sink boundary conditions\n")
+_p("\n─── PART 2: IR DROP SIMULATION (TEXTILE POWER MESH) ───")
+_p("Solving ∇²V = 0 with source and sink boundary conditions\n")
 
 N = 30  # Grid size (30x30 nodes representing ~30cm x 30cm garment)
 
 # Sheet resistance map (Ω/square)
 # Normal conductive yarn: ~1 Ω/square
 # Stretched/bent areas: higher resistance
-R_sheet = np.ones((N, N)) * 1.0
+R_sheet = np.ones((N, N), dtype=np.float32)
 
 # Simulate stretch zones
 R_sheet[12:18, 10:20] = 5.0   # Elbow bend (5x resistance)
@@ -72,7 +93,7 @@ R_sheet[0:3, :] = 3.0          # Shoulder flex
 R_sheet[25:30, 12:18] = 2.0    # Waist band flex
 
 # Voltage source (battery/supercap at center-back)
-V = np.zeros((N, N))
+V = np.zeros((N, N), dtype=np.float32)
 source_pos = (15, 28)  # Center-back
 V[source_pos[0], source_pos[1]] = 3.3  # Supply voltage
 
@@ -87,71 +108,126 @@ sink_positions = [
     (10, 15, 0.15), # BLE radio chest
     (20, 15, 0.1),  # Sensor waist
 ]
-
-# Relaxation solver (Jacobi iteration for Laplace equation)
-for iteration in range(2000):
-    V_old = V.copy()
-
-    # Interior points: average of neighbors weighted by conductance
-    for i in range(1, N-1):
-        for j in range(1, N-1):
-            if (i, j) == source_pos:
-                continue  # Fixed voltage source
-
-            # Conductance-weighted average
-            g_total = 0
-            v_sum = 0
-            for di, dj in [(-1,0),(1,0),(0,-1),(0,1)]:
-                g = 1.0 / R_sheet[i+di, j+dj]
-                g_total += g
-                v_sum += g * V_old[i+di, j+dj]
-
-            if g_total > 0:
-                V[i, j] = v_sum / g_total
-
-    # Apply current sinks (voltage drop = I × R_local)
-    for x, y, I_mA in sink_positions:
-        V[x, y] -= I_mA * R_sheet[x, y] * 0.001  # Tiny correction per iteration
+sink_xy = np.array([(x, y) for x, y, _ in sink_positions], dtype=np.intp)
+sink_I = np.array([I_mA for *_, I_mA in sink_positions], dtype=np.float64)
+
+
+def edge_conductances(R_x, R_y):
+    """Conductance of every grid edge as the harmonic mean of its two nodes.
+
+    ``R_x`` and ``R_y`` are the sheet resistances seen by current flowing
+    along axis 1 and axis 0 (warp and weft). Returns ``G_h`` of shape
+    (N, N-1) for horizontal edges and ``G_v`` of shape (N-1, N) for vertical
+    ones.
+    """
+    G_h = 2.0 / (R_x[:, :-1] + R_x[:, 1:])
+    G_v = 2.0 / (R_y[:-1, :] + R_y[1:, :])
+    return G_h, G_v
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def relax_rb(V, G_h, G_v, I_inject, src_i, src_j, V_src, n_iter, tol, omega=1.0):
+    """Red-black SOR relaxation of V in place; returns sweeps used, stopping early within tol."""
+    N = V.shape[0]
+    V_prev = np.empty_like(V)
+    V_prev[:] = V
+    for it in range(n_iter):
+        for color in range(2):
+            for i in prange(1, N-1):
+                for j in range(1 + ((i + color) & 1), N-1, 2):
+                    if i == src_i and j == src_j:
+                        continue  # Fixed voltage source
+                    g_n, g_s = G_v[i-1, j], G_v[i, j]
+                    g_w, g_e = G_h[i, j-1], G_h[i, j]
+                    V_gs = (g_n * V[i-1, j] + g_s * V[i+1, j]
+                            + g_w * V[i, j-1] + g_e * V[i, j+1]
+                            - I_inject[i, j]) / (g_n + g_s + g_w + g_e)
+                    V[i, j] += omega * (V_gs - V[i, j])
+        V[src_i, src_j] = V_src
+
+        if (it + 1) % 50 == 0:
+            if np.max(np.abs(V - V_prev)) < tol:
+                return it + 1
+            V_prev[:] = V
+    return n_iter
+
+
+def solve_direct(G_h, G_v, source_pos, V_src, sink_xy, sink_I):
+    """Solve the edge-conductance Laplacian for V with one sparse factorization.
+
+    Edge nodes are grounded, the source node is held at ``V_src`` and each
+    sink draws ``sink_I`` (mA) from its node (Kirchhoff's current law as the RHS).
+    """
+    N = G_h.shape[0]
+    A = scipy.sparse.lil_matrix((N*N, N*N), dtype=G_h.dtype)
+    b = np.zeros(N*N, dtype=G_h.dtype)
+    for i in range(N):
+        for j in range(N):
+            k = i*N + j
+            if i in (0, N-1) or j in (0, N-1):
+                A[k, k] = 1.0  # Grounded edge
+            elif (i, j) == source_pos:
+                A[k, k] = 1.0
+                b[k] = V_src
+            else:
+                g_n, g_s = G_v[i-1, j], G_v[i, j]
+                g_w, g_e = G_h[i, j-1], G_h[i, j]
+                A[k, k] = -(g_n + g_s + g_w + g_e)
+                A[k, k-N], A[k, k+N] = g_n, g_s
+                A[k, k-1], A[k, k+1] = g_w, g_e
+    np.add.at(b, sink_xy[:, 0]*N + sink_xy[:, 1], (sink_I * 1e-3).astype(G_h.dtype))
+    return scipy.sparse.linalg.spsolve(A.tocsr(), b).reshape(N, N)
+
+
+# Isotropic yarn for now: warp and weft see the same sheet resistance
+G_h, G_v = edge_conductances(R_sheet, R_sheet)
+
+if scipy is not None:
+    V = solve_direct(G_h, G_v, source_pos, 3.3, sink_xy, sink_I)
+else:
+    I_inject = np.zeros((N, N), dtype=V.dtype)
+    I_inject[sink_xy[:, 0], sink_xy[:, 1]] = sink_I * 1e-3
+    omega = 2.0 / (1.0 + np.sin(np.pi / N))
+    relax_rb(V, G_h, G_v, I_inject, source_pos[0], source_pos[1], 3.3, 2000, 1e-6, omega)
 
 # Report voltage at each sink
-print(f"Supply: {V[source_pos[0], source_pos[1]]:.2f}V at position {source_pos}")
-print()
-print(f"{'Sink Position':<16} {'V_delivered (V)':<16} {'V_drop (V)':<12} {'R_local (Ω/□)':<14} {'Status'}")
-print("-" * 70)
+_p(f"Supply: {V[source_pos[0], source_pos[1]]:.2f}V at position {source_pos}")
+_p()
+_p(f"{'Sink Position':<16} {'V_delivered (V)':<16} {'V_drop (V)':<12} {'R_local (Ω/□)':<14} {'Status'}")
+_p("-" * 70)
 
-for x, y, I_mA in sink_positions:
+for (x, y), I_mA in zip(sink_xy, sink_I):
     v_del = V[x, y]
     v_drop = 3.3 - v_del
     status = "OK" if v_del > 1.8 else "LOW" if v_del > 1.2 else "FAIL"
-    print(f"({x:2d},{y:2d}){'':<10} {v_del:<16.3f} {v_drop:<12.3f} {R_sheet[x,y]:<14.1f} {status}")
+    _p(f"({x:2d},{y:2d}){'':<10} {v_del:<16.3f} {v_drop:<12.3f} {R_sheet[x,y]:<14.1f} {status}")
 
 # ─── PART 3: Thermal Feedback from IR Drop ───
-print("\n─── PART 3: THERMAL FEEDBACK (P = I²R → Heat) ───")
-print("Hot spots where high current meets high resistance\n")
-
-# Power dissipation density
-P_density = np.zeros((N, N))
-for i in range(1, N-1):
-    for j in range(1, N-1):
-        # Current from voltage gradient
-        dVx = (V[i+1,j] - V[i-1,j]) / 2
-        dVy = (V[i,j+1] - V[i,j-1]) / 2
-        I_sq = (dVx**2 + dVy**2) / R_sheet[i,j]**2
-        P_density[i,j] = I_sq * R_sheet[i,j]
-
-# Find hotspots
-max_P = np.max(P_density)
-hotspots = np.argwhere(P_density > max_P * 0.5)
+_p("\n─── PART 3: THERMAL FEEDBACK (P = I²R → Heat) ───")
+_p("Hot spots where high current meets high resistance\n")
+
+# Power dissipation density from the central-difference voltage gradient
+P_density = np.zeros((N, N), dtype=np.float32)
+dVx = (V[2:, 1:-1] - V[:-2, 1:-1]) / 2
+dVy = (V[1:-1, 2:] - V[1:-1, :-2]) / 2
+P_density[1:-1, 1:-1] = (dVx*dVx + dVy*dVy) / R_sheet[1:-1, 1:-1]
 
-print(f"Peak power density: {max_P:.4e} W/m²")
-print(f"Hotspot count (>50% peak): {len(hotspots)}")
-if len(hotspots) > 0:
-    print(f"Hotspot regions:")
-    for h in hotspots[:5]:
-        print(f"  ({h[0]},{h[1]}) R={R_sheet[h[0],h[1]]:.1f} Ω/□  P={P_density[h[0],h[1]]:.4e}")
+# Find hotspots: count above 50% of peak, list the strongest few
+max_P = np.max(P_density)
+n_hot = np.count_nonzero(P_density > max_P * 0.5)
+k = min(n_hot, 5)
+top = np.argpartition(P_density.ravel(), -k)[-k:] if k else np.empty(0, dtype=np.intp)
+top = top[np.argsort(P_density.ravel()[top])[::-1]]
+
+_p(f"Peak power density: {max_P:.4e} W/m²")
+_p(f"Hotspot count (>50% peak): {n_hot}")
+if n_hot > 0:
+    _p(f"Hotspot regions:")
+    for hx, hy in zip(*np.unravel_index(top, P_density.shape)):
+        _p(f"  ({hx},{hy}) R={R_sheet[hx,hy]:.1f} Ω/□  P={P_density[hx,hy]:.4e}")
 
 # ─── PART 4: Optimization Recommendations ───
-print("\n─── PART 4: GRID OPTIMIZATION ───\n")
+_p("\n─── PART 4: GRID OPTIMIZATION ───\n")
 
 optimizations = [
     ("Add parallel yarns at elbows",   "R_elbow: 5.0→1.5 Ω/□", "Redundant conductive paths"),
@@ -162,14 +238,16 @@ optimizations = [
 ]
 
 for opt, effect, method in optimizations:
-    print(f"  → {opt}")
-    print(f"    Effect: {effect}")
-    print(f"    Method: {method}")
-    print()
-
-print("─── CONCLUSION ───")
-print(f"Power budget margin: {margin:.1f} μW ({margin/total_harvest*100:.0f}%)")
-print(f"Critical constraint: BLE transmit bursts require supercap buffer")
-print(f"Thermal risk: Low at these power levels (<1°C rise)")
-print(f"Grid integrity: Stretch zones need redundant conductive paths")
-print(f"Design rule: Route power around joints, not through them")
+    _p(f"  → {opt}")
+    _p(f"    Effect: {effect}")
+    _p(f"    Method: {method}")
+    _p()
+
+_p("─── CONCLUSION ───")
+_p(f"Power budget margin: {margin:.1f} μW ({margin/total_harvest*100:.0f}%)")
+_p(f"Critical constraint: BLE transmit bursts require supercap buffer")
+_p(f"Thermal risk: Low at these power levels (<1°C rise)")
+_p(f"Grid integrity: Stretch zones need redundant conductive paths")
+_p(f"Design rule: Route power around joints, not through them")
+
+sys.stdout.write(_buf.getvalue())
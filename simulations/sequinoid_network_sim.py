@@ -22,8 +22,15 @@ References:
   - Metamaterial absorber: Landy et al., Phys. Rev. Lett. 100, 2008
 """
 
+import argparse
+
 import numpy as np
 
+try:
+    from ._numba_compat import njit, prange
+except ImportError:  # run as a script from simulations/
+    from _numba_compat import njit, prange
+
 # ═══════════════════════════════════════════════════════════
 # Physical Constants
 # ═══════════════════════════════════════════════════════════
@@ -34,151 +41,245 @@ T_body = 310.15    # body temperature (K)
 G_ATP = 30.5e3     # Gibbs free energy ATP hydrolysis (J/mol)
 N_A = 6.022e23     # Avogadro's number
 
+# Frequency display units: Hz below 1 kHz, kHz below 1 MHz, else MHz
+FREQ_EDGES = np.array([1e3, 1e6])
+FREQ_SCALES = np.array([1, 1e-3, 1e-6])
+FREQ_SUFFIXES = np.array(["Hz", "kHz", "MHz"])
+FREQ_DECIMALS = np.array([2, 0, 0])
+
+# Wavelength display units: μm below 1 mm, mm below 1 m, else m
+LAM_EDGES = np.array([1e-3, 1])
+LAM_SCALES = np.array([1e6, 1e3, 1])
+LAM_SUFFIXES = np.array(["μm", "mm", "m"])
+LAM_DECIMALS = np.array([0, 1, 2])
+
+# Duration display units: ms below 1 s, s below 1 min, else min
+TIME_EDGES = np.array([1, 60])
+TIME_SCALES = np.array([1e3, 1, 1/60])
+TIME_SUFFIXES = np.array(["ms", "s", "min"])
+
+
 def banner(title):
     w = 60
     print("\n" + "=" * w)
     print(f"  {title}")
     print("=" * w)
 
+
+# Lorentzian absorption model centered at design frequency
+f_design = 5.0  # GHz, center of absorption band
+bw = 50.0       # GHz, bandwidth (broadband design)
+
+
+def absorption(f, f0=f_design, bw=bw, peak=0.97):
+    """Broadband metamaterial absorption model."""
+    # Wide Lorentzian for broadband absorber
+    return peak * (1 - 0.03 * ((f - f0) / bw) ** 2) * np.clip(f / 0.5, 0, 1)
+
+
+@njit(cache=True, fastmath=True)
+def kuramoto_rhs(theta, omega, K, e, out):
+    """Write dθ/dt of the mean-field Kuramoto model into ``out``.
+
+    ``e`` is scratch space for e^(jθ).
+    """
+    # One complex exponential per oscillator gives both cos and sin;
+    # the order parameter and the coupling share it
+    for i in range(theta.shape[0]):
+        e[i] = np.exp(np.complex64(1j) * theta[i])
+    z = e.mean()
+    # (K/N) Σⱼ sin(θⱼ - θ_i) = K × Im(z e^(-jθ_i))
+    for i in range(theta.shape[0]):
+        out[i] = omega[i] + K * (z.imag * e[i].real - z.real * e[i].imag)
+
+
+@njit(cache=True, fastmath=True)
+def run_kuramoto(theta, omega, K, dt, theta_hist):
+    """RK4-integrate the mean-field Kuramoto model from phases ``theta``.
+
+    Writes the phases at the start of every step into ``theta_hist``
+    (steps, N). ``theta`` is not modified. The state is float32 throughout;
+    the RK4 weights are float32 too so no step promotes to float64.
+    """
+    N = theta.shape[0]
+    theta = theta.copy()
+    e = np.empty(N, dtype=np.complex64)
+    k1, k2, k3, k4 = (np.empty(N, dtype=np.float32), np.empty(N, dtype=np.float32),
+                      np.empty(N, dtype=np.float32), np.empty(N, dtype=np.float32))
+    y = np.empty(N, dtype=np.float32)  # stage input, reused so the loop never allocates
+    half, sixth, two = np.float32(0.5) * dt, dt / np.float32(6.0), np.float32(2.0)
+
+    for step in range(theta_hist.shape[0]):
+        theta_hist[step] = theta
+        kuramoto_rhs(theta, omega, K, e, k1)
+        for i in range(N):
+            y[i] = theta[i] + half * k1[i]
+        kuramoto_rhs(y, omega, K, e, k2)
+        for i in range(N):
+            y[i] = theta[i] + half * k2[i]
+        kuramoto_rhs(y, omega, K, e, k3)
+        for i in range(N):
+            y[i] = theta[i] + dt * k3[i]
+        kuramoto_rhs(y, omega, K, e, k4)
+        for i in range(N):
+            theta[i] += sixth * (k1[i] + two * k2[i] + two * k3[i] + k4[i])
+
+
+@njit(parallel=True, cache=True)
+def sweep(Ks, thetas0, omega, dt, steps):
+    """Run one Kuramoto simulation per coupling ``Ks[k]`` from ``thetas0[k]``.
+
+    The runs are independent and execute in parallel. Returns the phase
+    history of every run, shape (len(Ks), steps, N).
+    """
+    theta_hists = np.empty((Ks.shape[0], steps, thetas0.shape[1]), dtype=np.float32)
+    for k in prange(Ks.shape[0]):
+        run_kuramoto(thetas0[k], omega, Ks[k], dt, theta_hists[k])
+    return theta_hists
+
+
 # ═══════════════════════════════════════════════════════════
 # PART 1: Harmonic Frequency Response
 # ═══════════════════════════════════════════════════════════
-banner("PART 1: HARMONIC FREQUENCY RESPONSE")
+def run_part1():
+    """Tissue response to therapeutic stimulation frequencies."""
+    banner("PART 1: HARMONIC FREQUENCY RESPONSE")
 
-print("""
+    print("""
 Tissue modeled as damped harmonic oscillator:
   x(t) = A₀ × e^(-γt) × cos(2πf_stim × t)
   Response amplitude: |H(f)| = 1/√((f₀²-f²)² + (γf/π)²)
 """)
 
-# Therapeutic frequencies
-therapies = [
-    ("Schumann / Global Balance", 7.83),
-    ("Bone Repair (low)", 25.0),
-    ("Bone Repair (high) / Nerve", 50.0),
-    ("Muscle Recovery", 200.0),
-]
-
-# Tissue natural frequencies and damping
-tissues = {
-    "Bone":   {"f0": 40.0,  "gamma": 0.8,  "threshold_strain": 500e-6},
-    "Nerve":  {"f0": 55.0,  "gamma": 1.5,  "threshold_strain": 100e-6},
-    "Muscle": {"f0": 180.0, "gamma": 2.0,  "threshold_strain": 200e-6},
-    "Brain":  {"f0": 10.0,  "gamma": 0.3,  "threshold_strain": 50e-6},
-}
-
-print(f"{'Tissue':<10} {'f₀ (Hz)':<10} {'γ (s⁻¹)':<10} {'Threshold (με)':<15}")
-print("-" * 45)
-for name, props in tissues.items():
-    print(f"{name:<10} {props['f0']:<10.1f} {props['gamma']:<10.1f} {props['threshold_strain']*1e6:<15.0f}")
-
-print("\nResponse Matrix |H(f)| (normalized):")
-print(f"{'':>25}", end="")
-for name in tissues:
-    print(f"{name:>10}", end="")
-print()
-
-for therapy_name, f_stim in therapies:
-    print(f"  {therapy_name:<23}", end="")
-    for name, props in tissues.items():
-        f0 = props["f0"]
-        gamma = props["gamma"]
-        denom = np.sqrt((f0**2 - f_stim**2)**2 + (gamma * f_stim / np.pi)**2)
-        H = f0**2 / denom if denom > 0 else 1.0
-        print(f"{H:>10.3f}", end="")
-    print()
-
-# Schumann resonance modes
-print("\nSchumann Resonance Modes:")
-print(f"  {'n':<4} {'f_n (Hz)':<12} {'λ (km)':<12}")
-for n in range(1, 7):
+    # Therapeutic frequencies
+    therapies = [
+        ("Schumann / Global Balance", 7.83),
+        ("Bone Repair (low)", 25.0),
+        ("Bone Repair (high) / Nerve", 50.0),
+        ("Muscle Recovery", 200.0),
+    ]
+
+    # Tissue natural frequencies and damping
+    tissues = np.array([
+        ("Bone",   40.0,  0.8,  500e-6),
+        ("Nerve",  55.0,  1.5,  100e-6),
+        ("Muscle", 180.0, 2.0,  200e-6),
+        ("Brain",  10.0,  0.3,  50e-6),
+    ], dtype=[("name", "U8"), ("f0", "f8"), ("gamma", "f8"), ("threshold_strain", "f8")])
+
+    tissue_row = "{:<10} {:<10.1f} {:<10.1f} {:<15.0f}".format
+    print(f"{'Tissue':<10} {'f₀ (Hz)':<10} {'γ (s⁻¹)':<10} {'Threshold (με)':<15}")
+    print("-" * 45)
+    print("\n".join(map(tissue_row, tissues["name"], tissues["f0"], tissues["gamma"],
+                      tissues["threshold_strain"] * 1e6)))
+
+    print("\nResponse Matrix |H(f)| (normalized):")
+    print(f"{'':>25}" + "".join(f"{name:>10}" for name in tissues["name"]))
+
+    f0 = tissues["f0"]
+    gamma = tissues["gamma"]
+    f_stim = np.array([f for _, f in therapies])
+
+    # Rows: therapies, columns: tissues
+    denom = np.sqrt((f0[None, :]**2 - f_stim[:, None]**2)**2 + (gamma[None, :] * f_stim[:, None] / np.pi)**2)
+    H = np.divide(f0[None, :]**2, denom, out=np.ones_like(denom), where=denom > 0)
+
+    for (therapy_name, _), H_row in zip(therapies, H):
+        print(f"  {therapy_name:<23}" + "".join(f"{h:>10.3f}" for h in H_row))
+
+    # Schumann resonance modes
+    print("\nSchumann Resonance Modes:")
+    print(f"  {'n':<4} {'f_n (Hz)':<12} {'λ (km)':<12}")
+    n = np.arange(1, 7)
     f_n = (c / (2 * np.pi * R_earth)) * np.sqrt(n * (n + 1))
-    lam = c / f_n / 1000
-    print(f"  {n:<4} {f_n:<12.2f} {lam:<12.0f}")
+    lam_km = c / f_n / 1000
+    mode_row = "  {:<4} {:<12.2f} {:<12.0f}".format
+    print("\n".join(map(mode_row, n, f_n, lam_km)))
+
 
 # ═══════════════════════════════════════════════════════════
 # PART 2: Gold-on-Black Metamaterial Absorption
 # ═══════════════════════════════════════════════════════════
-banner("PART 2: GOLD-ON-BLACK METAMATERIAL ABSORPTION")
+def run_part2():
+    """Au/Fe₃O₄ metamaterial absorption spectrum."""
+    banner("PART 2: GOLD-ON-BLACK METAMATERIAL ABSORPTION")
 
-print("""
+    print("""
 Au/Fe₃O₄ composite metamaterial absorber.
 Near-perfect absorption via impedance matching to free space.
   R(λ) = |(n₁ - n_eff)/(n₁ + n_eff)|²
   A(λ) = 1 - R(λ) - T(λ)  [T ≈ 0 for backed absorber]
 """)
 
-# Model absorption vs frequency
-freqs_ghz = np.array([0.1, 0.5, 1.0, 2.4, 5.0, 10.0, 30.0, 60.0, 100.0, 300.0])
-
-# Lorentzian absorption model centered at design frequency
-f_design = 5.0  # GHz, center of absorption band
-bw = 50.0       # GHz, bandwidth (broadband design)
-
-def absorption(f, f0=f_design, bw=bw, peak=0.97):
-    """Broadband metamaterial absorption model."""
-    # Wide Lorentzian for broadband absorber
-    return peak * (1 - 0.03 * ((f - f0) / bw) ** 2) * np.clip(f / 0.5, 0, 1)
+    # Model absorption vs frequency
+    freqs_ghz = np.array([0.1, 0.5, 1.0, 2.4, 5.0, 10.0, 30.0, 60.0, 100.0, 300.0])
 
-print(f"{'Freq (GHz)':<12} {'Wavelength':<14} {'Absorption':<12} {'Reflectivity':<12} {'Unit Cell':<12}")
-print("-" * 62)
-for f in freqs_ghz:
-    lam = c / (f * 1e9)
-    A = np.clip(absorption(f), 0, 0.99)
+    print(f"{'Freq (GHz)':<12} {'Wavelength':<14} {'Absorption':<12} {'Reflectivity':<12} {'Unit Cell':<12}")
+    print("-" * 62)
+    lam = c / (freqs_ghz * 1e9)
+    A = np.clip(absorption(freqs_ghz), 0, 0.99)
     R = 1 - A
     d_cell = lam / 10  # sub-wavelength unit cell
-    if lam >= 1:
-        lam_str = f"{lam:.2f} m"
-    elif lam >= 1e-3:
-        lam_str = f"{lam*1e3:.1f} mm"
-    else:
-        lam_str = f"{lam*1e6:.0f} μm"
-    print(f"{f:<12.1f} {lam_str:<14} {A:<12.3f} {R:<12.4f} {d_cell*100:<8.2f} cm")
-
-# Fibonacci spiral geometry
-phi = (1 + np.sqrt(5)) / 2
-print(f"\nGolden Spiral Parameters:")
-print(f"  φ (golden ratio) = {phi:.6f}")
-print(f"  r(θ) = a × φ^(2θ/π)")
-print(f"  At 2.4 GHz: unit cell = {c/(2.4e9)/10*100:.1f} cm")
-print(f"  Array of 100 cells: capture area = {100 * np.pi * (c/(2.4e9)/10)**2 * 1e4:.0f} cm²")
+    lam_idx = np.searchsorted(LAM_EDGES, lam, side="right")
+    lam_val = lam * LAM_SCALES[lam_idx]
+
+    for f, lam_v, unit, dec, A_i, R_i, d_i in zip(
+            freqs_ghz, lam_val, LAM_SUFFIXES[lam_idx], LAM_DECIMALS[lam_idx], A, R, d_cell):
+        lam_str = f"{lam_v:.{dec}f} {unit}"
+        print(f"{f:<12.1f} {lam_str:<14} {A_i:<12.3f} {R_i:<12.4f} {d_i*100:<8.2f} cm")
+
+    # Fibonacci spiral geometry
+    phi = (1 + np.sqrt(5)) / 2
+    print(f"\nGolden Spiral Parameters:")
+    print(f"  φ (golden ratio) = {phi:.6f}")
+    print(f"  r(θ) = a × φ^(2θ/π)")
+    print(f"  At 2.4 GHz: unit cell = {c/(2.4e9)/10*100:.1f} cm")
+    print(f"  Array of 100 cells: capture area = {100 * np.pi * (c/(2.4e9)/10)**2 * 1e4:.0f} cm²")
+
 
 # ═══════════════════════════════════════════════════════════
 # PART 3: Body-Resonance HBC Channel
 # ═══════════════════════════════════════════════════════════
-banner("PART 3: BODY-RESONANCE HBC CHANNEL")
+def run_part3():
+    """Body-as-transmission-line HBC channel."""
+    banner("PART 3: BODY-RESONANCE HBC CHANNEL")
 
-print("""
+    print("""
 Human body as transmission line for Sequinoid Packet routing.
   Z_body = √((R + j2πfL) / (G + j2πfC))
   Path loss: PL = 20 × log10(e^(-αd))
 """)
 
-# Body transmission line parameters
-R_body = 200    # Ω/m (tissue resistance)
-L_body = 1.5e-6 # H/m (body inductance)
-C_body = 50e-12  # F/m (body capacitance)
-G_body = 0.01    # S/m (tissue conductance)
+    # Body transmission line parameters
+    R_body = 200    # Ω/m (tissue resistance)
+    L_body = 1.5e-6 # H/m (body inductance)
+    C_body = 50e-12  # F/m (body capacitance)
+    G_body = 0.01    # S/m (tissue conductance)
 
-hbc_freqs = [7.83, 25, 50, 200, 1e3, 10e3, 1e6]
+    hbc_freqs = [7.83, 25, 50, 200, 1e3, 10e3, 1e6]
 
-print(f"{'Frequency':<14} {'|Z| (Ω)':<12} {'α (Np/m)':<12} {'PL/m (dB)':<12} {'Range (m)':<10}")
-print("-" * 60)
-for f in hbc_freqs:
+    print(f"{'Frequency':<14} {'|Z| (Ω)':<12} {'α (Np/m)':<12} {'PL/m (dB)':<12} {'Range (m)':<10}")
+    print("-" * 60)
+    f = np.array(hbc_freqs, dtype=np.float64)
     w = 2 * np.pi * f
     Z_series = R_body + 1j * w * L_body
     Y_shunt = G_body + 1j * w * C_body
     Z_char = np.sqrt(Z_series / Y_shunt)
     gamma = np.sqrt(Z_series * Y_shunt)
-    alpha = np.real(gamma)  # attenuation constant
-    PL_per_m = 20 * np.log10(np.exp(-alpha)) if alpha > 0 else 0
+    alpha = gamma.real  # attenuation constant
+    PL_per_m = np.where(alpha > 0, 20 * np.log10(np.exp(-alpha)), 0.0)
     # Usable range: where signal > -40 dB
-    max_range = -40 / PL_per_m if PL_per_m < 0 else 99
-    max_range = min(max_range, 99)
-    f_str = f"{f:.2f} Hz" if f < 1e3 else f"{f/1e3:.0f} kHz" if f < 1e6 else f"{f/1e6:.0f} MHz"
-    print(f"{f_str:<14} {abs(Z_char):<12.1f} {alpha:<12.4f} {PL_per_m:<12.1f} {max_range:<10.1f}")
+    max_range = np.divide(-40, PL_per_m, out=np.full_like(PL_per_m, 99.0), where=PL_per_m < 0)
+    max_range = np.minimum(max_range, 99)
+    f_idx = np.searchsorted(FREQ_EDGES, f, side="right")
+    f_val = f * FREQ_SCALES[f_idx]
+
+    f_strs = [f"{f_v:.{dec}f} {unit}" for f_v, unit, dec in zip(f_val, FREQ_SUFFIXES[f_idx], FREQ_DECIMALS[f_idx])]
 
-print(f"""
+    hbc_row = "{:<14} {:<12.1f} {:<12.4f} {:<12.1f} {:<10.1f}".format
+    print("\n".join(map(hbc_row, f_strs, np.abs(Z_char), alpha, PL_per_m, max_range)))
+
+    print(f"""
 HBC Link Budget:
   Tx power:     100 μW (0.1 mW)
   Body path:    1.5 m typical
@@ -190,12 +291,15 @@ HBC Link Budget:
   Data rate:      1-10 Mbps (capacitive coupling)
   Latency:        < 1 ms""")
 
+
 # ═══════════════════════════════════════════════════════════
 # PART 4: Network Protocol (Kuramoto Synchronization)
 # ═══════════════════════════════════════════════════════════
-banner("PART 4: KURAMOTO NETWORK SYNCHRONIZATION")
+def run_part4():
+    """Kuramoto phase locking across the user network."""
+    banner("PART 4: KURAMOTO NETWORK SYNCHRONIZATION")
 
-print("""
+    print("""
 Sequinoid Packet network uses Kuramoto model for phase locking:
   dθ_i/dt = ω_i + (K/N) × Σⱼ sin(θⱼ - θ_i)
 
@@ -203,57 +307,58 @@ Order parameter r = (1/N)|Σ e^(jθ_i)| measures coherence:
   r → 0: incoherent   r → 1: fully synchronized
 """)
 
-np.random.seed(42)
-
-N_users = 20
-f_schumann = 7.83  # Hz
-
-# Natural frequencies (slight drift around Schumann)
-sigma_omega = 0.5  # Hz standard deviation
-omega = 2 * np.pi * (f_schumann + np.random.normal(0, sigma_omega, N_users))
-
-# Critical coupling
-K_c = 2 * (2 * np.pi * sigma_omega) / np.pi
-print(f"Network: {N_users} users")
-print(f"Natural frequency: {f_schumann} ± {sigma_omega} Hz")
-print(f"Critical coupling K_c = {K_c:.3f}")
-
-# Simulate for different coupling strengths
-dt = 0.001  # seconds
-T_sim = 5.0
-steps = int(T_sim / dt)
-
-print(f"\nSynchronization vs Coupling Strength:")
-print(f"{'K/K_c':<8} {'r (final)':<12} {'Sync Time (s)':<15} {'Status':<20}")
-print("-" * 55)
-
-for K_ratio in [0.0, 0.5, 1.0, 1.5, 2.0, 3.0, 5.0]:
-    K = K_ratio * K_c
-    theta = np.random.uniform(0, 2 * np.pi, N_users)
-    r_history = []
-    sync_time = None
-
-    for step in range(steps):
-        # Compute order parameter
-        z = np.mean(np.exp(1j * theta))
-        r = abs(z)
-        r_history.append(r)
-
-        if r > 0.9 and sync_time is None:
-            sync_time = step * dt
-
-        # Kuramoto dynamics
-        coupling = np.zeros(N_users)
-        for i in range(N_users):
-            coupling[i] = (K / N_users) * np.sum(np.sin(theta - theta[i]))
-        theta += (omega + coupling) * dt
-
-    r_final = np.mean(r_history[-100:])
-    sync_str = f"{sync_time:.2f}" if sync_time else ">5.0"
-    status = "LOCKED" if r_final > 0.9 else "PARTIAL" if r_final > 0.5 else "INCOHERENT"
-    print(f"{K_ratio:<8.1f} {r_final:<12.3f} {sync_str:<15} {status:<20}")
-
-print(f"""
+    rng = np.random.default_rng(42)
+
+    N_users = 20
+    f_schumann = 7.83  # Hz
+
+    # Natural frequencies (slight drift around Schumann)
+    sigma_omega = 0.5  # Hz standard deviation
+    omega = 2 * np.pi * (f_schumann + rng.normal(0, sigma_omega, N_users))
+    omega = omega.astype(np.float32)
+
+    # Critical coupling
+    K_c = 2 * (2 * np.pi * sigma_omega) / np.pi
+    print(f"Network: {N_users} users")
+    print(f"Natural frequency: {f_schumann} ± {sigma_omega} Hz")
+    print(f"Critical coupling K_c = {K_c:.3f}")
+
+    # Simulate for different coupling strengths. RK4 is accurate at dt = 10 ms,
+    # well below the fastest natural period (~0.11 s)
+    dt = 0.01  # seconds
+    T_sim = 5.0
+    steps = int(T_sim / dt)
+    n_tail = int(round(0.1 / dt))  # r (final) is averaged over the last 0.1 s
+
+    print(f"\nSynchronization vs Coupling Strength:")
+    print(f"{'K/K_c':<8} {'r (final)':<12} {'Sync Time (s)':<15} {'Status':<20}")
+    print("-" * 55)
+
+    K_ratios = np.array([0.0, 0.5, 1.0, 1.5, 2.0, 3.0, 5.0])
+    # Initial phases for every run, drawn up front so each run is reproducible
+    # on its own and the sweep can run in parallel
+    thetas0 = rng.uniform(0, 2 * np.pi, (len(K_ratios), N_users))
+    # float32 phases keep r to well over 3 significant figures across the run
+    # and halve the memory traffic of the state and the histories
+    theta_hists = sweep((K_ratios * K_c).astype(np.float32), thetas0.astype(np.float32),
+                        omega, np.float32(dt), steps)
+    # Order parameter for every run and step in one pass over the histories
+    # (complex64 since the phases are float32)
+    r_hist = np.abs(np.exp(1j * theta_hists).mean(axis=-1))
+    r_finals = r_hist[:, -n_tail:].mean(axis=1)
+
+    # Sync time is the first step with r > 0.9; argmax returns 0 when no
+    # step qualifies, so check the hit before trusting it
+    locked = r_hist > 0.9
+    idx = locked.argmax(axis=1)
+    synced = locked[np.arange(len(K_ratios)), idx]
+    sync_strs = np.where(synced, np.char.mod("%.2f", idx * dt), ">5.0")
+    status = np.select([r_finals > 0.9, r_finals > 0.5], ["LOCKED", "PARTIAL"], default="INCOHERENT")
+
+    sync_row = "{:<8.1f} {:<12.3f} {:<15} {:<20}".format
+    print("\n".join(map(sync_row, K_ratios, r_finals, sync_strs, status)))
+
+    print(f"""
 Network Protocol Summary:
   • K/K_c ≥ 1.5 needed for reliable phase lock
   • 20-user network syncs in < 1 second at K/K_c = 2
@@ -261,12 +366,15 @@ Network Protocol Summary:
   • Nearby devices couple inductively through black sand windings
   • Global Resonant Array achieved when r > 0.9""")
 
+
 # ═══════════════════════════════════════════════════════════
 # PART 5: ATP Trigger Threshold
 # ═══════════════════════════════════════════════════════════
-banner("PART 5: ATP TRIGGER THRESHOLD")
+def run_part5():
+    """Stimulation energy against the ATP trigger threshold."""
+    banner("PART 5: ATP TRIGGER THRESHOLD")
 
-print("""
+    print("""
 The Sequinoid Packet is a CATALYST, not an energy source.
 It provides activation energy; cell metabolism amplifies 10⁴-10⁶×.
 
@@ -275,42 +383,33 @@ It provides activation energy; cell metabolism amplifies 10⁴-10⁶×.
   Amplification: 1 glucose → 36 ATP (oxidative phosphorylation)
 """)
 
-# Energy delivery model
-stim_power_uW = [1, 5, 10, 50, 100, 500]  # μW stimulation power
-area_cm2 = 1.0  # target area
-threshold_mJ_cm2 = 0.5  # mechanotransduction threshold
+    # Energy delivery model
+    stim_power_uW = [1, 5, 10, 50, 100, 500]  # μW stimulation power
+    area_cm2 = 1.0  # target area
+    threshold_mJ_cm2 = 0.5  # mechanotransduction threshold
 
-print(f"Target area: {area_cm2} cm²")
-print(f"Activation threshold: {threshold_mJ_cm2} mJ/cm²")
-print(f"ATP energy: {G_ATP/1000:.1f} kJ/mol = {G_ATP/N_A*1e21:.1f} zJ/molecule")
-print()
+    print(f"Target area: {area_cm2} cm²")
+    print(f"Activation threshold: {threshold_mJ_cm2} mJ/cm²")
+    print(f"ATP energy: {G_ATP/1000:.1f} kJ/mol = {G_ATP/N_A*1e21:.1f} zJ/molecule")
+    print()
 
-print(f"{'P_stim (μW)':<14} {'Time to Threshold':<20} {'ATP Triggered':<15} {'Bio Amplification':<20}")
-print("-" * 69)
-for P in stim_power_uW:
-    P_watts = P * 1e-6
+    P = np.array(stim_power_uW)
     E_threshold_J = threshold_mJ_cm2 * 1e-3 * area_cm2 * 1e-4  # J
-    t_threshold = E_threshold_J / P_watts
+    t_threshold = E_threshold_J / (P * 1e-6)
     # One glucose molecule yields 36 ATP ≈ 36 × 50 zJ = 1800 zJ
-    # Input energy per trigger event
-    E_input = E_threshold_J
-    # Biological amplification (ATP production from glucose metabolism)
-    # ~2840 kJ/mol glucose released, ~1100 kJ/mol captured as ATP
-    amplification = 1100e3 / (E_input * N_A) if E_input > 0 else 0
-    amplification = min(amplification, 1e6)
-    n_atp = int(36 * P / 10)  # rough scaling
-    n_atp = min(n_atp, 10000)
-
-    if t_threshold < 1:
-        t_str = f"{t_threshold*1000:.1f} ms"
-    elif t_threshold < 60:
-        t_str = f"{t_threshold:.1f} s"
-    else:
-        t_str = f"{t_threshold/60:.1f} min"
-
-    print(f"{P:<14} {t_str:<20} {n_atp:<15} {amplification:<20.0f}×")
-
-print(f"""
+    # Biological amplification (ATP production from glucose metabolism) per
+    # trigger event; ~2840 kJ/mol glucose released, ~1100 kJ/mol captured as ATP
+    amplification = min(1100e3 / (E_threshold_J * N_A), 1e6) if E_threshold_J > 0 else 0
+    n_atp = np.minimum((36 * P / 10).astype(int), 10000)  # rough scaling
+    t_idx = np.searchsorted(TIME_EDGES, t_threshold, side="right")
+    t_strs = [f"{t_v:.1f} {unit}" for t_v, unit in zip(t_threshold * TIME_SCALES[t_idx], TIME_SUFFIXES[t_idx])]
+
+    print(f"{'P_stim (μW)':<14} {'Time to Threshold':<20} {'ATP Triggered':<15} {'Bio Amplification':<20}")
+    print("-" * 69)
+    atp_row = "{:<14} {:<20} {:<15} {:<20.0f}×".format
+    print("\n".join(atp_row(P_i, t_str, n_i, amplification) for P_i, t_str, n_i in zip(P, t_strs, n_atp)))
+
+    print(f"""
 Cure Circuit Event Sequence:
   1. Packet arrives at pain site (t=0)
   2. Vibrates at therapeutic frequency for {threshold_mJ_cm2/0.01:.0f}+ ms
@@ -323,11 +422,13 @@ Cure Circuit Event Sequence:
   9. Excess energy shared to network via HBC
   10. Global array re-balances at 7.83 Hz""")
 
+
 # ═══════════════════════════════════════════════════════════
 # SUMMARY
 # ═══════════════════════════════════════════════════════════
-banner("MODULE G SUMMARY")
-print("""
+def run_summary():
+    banner("MODULE G SUMMARY")
+    print("""
 Sequinoid Packet Network — The Cure Circuit
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
   Metamaterial:   Au/Fe₃O₄ black sand, >97% absorption
@@ -339,3 +440,22 @@ Sequinoid Packet Network — The Cure Circuit
   Network:        Global Resonant Array at Schumann fundamental
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """)
+
+
+PARTS = {1: run_part1, 2: run_part2, 3: run_part3, 4: run_part4, 5: run_part5}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Module G: Sequinoid Packet Network Simulation")
+    parser.add_argument("-p", "--part", type=int, action="append", choices=sorted(PARTS),
+                        help="run only this part (repeatable); default runs all parts and the summary")
+    args = parser.parse_args(argv)
+
+    for n in args.part or sorted(PARTS):
+        PARTS[n]()
+    if not args.part:
+        run_summary()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,110 +6,146 @@ C13B0 Structural Engine — Module B
 Models heat generation, dissipation, and safety limits
 for body-worn electronics. Ensures no thermal harm.
 """
-import numpy as np
+import argparse
 
-print("Thermal Safety Model for Wearable Electronics")
-print("=" * 70)
+import numpy as np
 
 # ─── Safety Limits ───
-print("\n─── SAFETY LIMITS (IEC 60601-1 / ISO 13732) ───")
-limits = {
-    "Skin contact (continuous)": {"T_max": 43, "note": "No burn below 43°C indefinitely"},
-    "Skin contact (1 min)":      {"T_max": 48, "note": "Reversible discomfort"},
-    "Skin contact (10 sec)":     {"T_max": 51, "note": "Pain threshold"},
-    "Burn threshold":            {"T_max": 55, "note": "Tissue damage begins"},
-    "Body core":                 {"T_max": 37, "note": "Normal internal temp"},
-    "Skin surface":              {"T_max": 33, "note": "Normal skin temp"},
-}
-
-print(f"{'Condition':<30} {'T_max (°C)':<12} {'Note'}")
-print("-" * 70)
-for name, lim in limits.items():
-    print(f"{name:<30} {lim['T_max']:<12} {lim['note']}")
+limits = np.array([
+    ("Skin contact (continuous)", 43, "No burn below 43°C indefinitely"),
+    ("Skin contact (1 min)",      48, "Reversible discomfort"),
+    ("Skin contact (10 sec)",     51, "Pain threshold"),
+    ("Burn threshold",            55, "Tissue damage begins"),
+    ("Body core",                 37, "Normal internal temp"),
+    ("Skin surface",              33, "Normal skin temp"),
+], dtype=[("name", "U28"), ("T_max", "i8"), ("note", "U32")])
 
 # ─── Heat Generation ───
-print("\n─── HEAT GENERATION BY COMPONENT ───")
-print("P = V × I  |  Q = P × t\n")
-
-components = {
-    "BLE radio (tx burst)":   {"P_mW": 15,   "duty": 0.01, "desc": "1% duty, 1 pkt/s"},
-    "MCU active":             {"P_mW": 5,     "duty": 0.05, "desc": "5% duty cycle"},
-    "MCU sleep":              {"P_mW": 0.005, "duty": 0.95, "desc": "95% of time"},
-    "Sensor ADC":             {"P_mW": 0.5,   "duty": 0.10, "desc": "10% sampling"},
-    "LED indicator":          {"P_mW": 20,    "duty": 0.001,"desc": "Brief flash"},
-    "NFC (passive)":          {"P_mW": 0,     "duty": 0,    "desc": "Powered by reader"},
-    "Flex display (e-ink)":   {"P_mW": 5,     "duty": 0.002,"desc": "Update only"},
-}
-
-print(f"{'Component':<24} {'Peak (mW)':<12} {'Duty':<8} {'Avg (mW)':<12} {'Note'}")
-print("-" * 70)
-total_avg = 0
-for name, c in components.items():
-    avg = c["P_mW"] * c["duty"]
-    total_avg += avg
-    print(f"{name:<24} {c['P_mW']:<12.3f} {c['duty']:<8.3f} {avg:<12.4f} {c['desc']}")
-
-print(f"\n{'TOTAL AVERAGE':<24} {'—':<12} {'—':<8} {total_avg:<12.4f} mW")
+components = np.array([
+    ("BLE radio (tx burst)",   15,    0.01,  "1% duty, 1 pkt/s"),
+    ("MCU active",             5,     0.05,  "5% duty cycle"),
+    ("MCU sleep",              0.005, 0.95,  "95% of time"),
+    ("Sensor ADC",             0.5,   0.10,  "10% sampling"),
+    ("LED indicator",          20,    0.001, "Brief flash"),
+    ("NFC (passive)",          0,     0,     "Powered by reader"),
+    ("Flex display (e-ink)",   5,     0.002, "Update only"),
+], dtype=[("name", "U24"), ("P_mW", "f8"), ("duty", "f8"), ("desc", "U20")])
+
+avg_mW = components["P_mW"] * components["duty"]
+total_avg = avg_mW.sum()
 
 # ─── Thermal Model ───
-print("\n─── THERMAL MODEL ───")
-print("ΔT = P × R_thermal")
-print("R_thermal = thickness / (k × area)\n")
-
 # Thermal resistance stack: component → PCB → encapsulation → air gap → skin
-layers = {
-    "Silicon die":      {"k": 150,  "L": 0.5e-3, "A": 4e-6},
-    "PCB (FR4)":        {"k": 0.3,  "L": 1e-3,   "A": 100e-6},
-    "Encapsulation":    {"k": 0.2,  "L": 0.5e-3, "A": 200e-6},
-    "Air gap":          {"k": 0.026,"L": 1e-3,   "A": 200e-6},
-    "Skin (epidermis)": {"k": 0.21, "L": 0.1e-3, "A": 200e-6},
-}
-
-print(f"{'Layer':<20} {'k (W/m·K)':<12} {'L (mm)':<10} {'A (mm²)':<10} {'R_th (K/W)'}")
-print("-" * 70)
-R_total = 0
-for name, lay in layers.items():
-    R = lay["L"] / (lay["k"] * lay["A"])
-    R_total += R
-    print(f"{name:<20} {lay['k']:<12.3f} {lay['L']*1e3:<10.2f} {lay['A']*1e6:<10.1f} {R:<10.1f}")
-
-print(f"\n{'TOTAL R_thermal':<20} {'':12} {'':10} {'':10} {R_total:<10.1f} K/W")
-
-# Temperature rise for various power levels
-print("\n─── TEMPERATURE RISE AT SKIN ───")
-print(f"Ambient skin temp: 33°C  |  Safety limit: 43°C  |  Budget: 10°C\n")
-
-powers_mW = [0.01, 0.05, 0.1, 0.5, 1, 5, 10, 50, 100]
-print(f"{'Power (mW)':<14} {'ΔT (°C)':<12} {'T_skin (°C)':<14} {'Status'}")
-print("-" * 55)
-for P in powers_mW:
+layers = np.array([
+    ("Silicon die",      150,   0.5e-3, 4e-6),
+    ("PCB (FR4)",        0.3,   1e-3,   100e-6),
+    ("Encapsulation",    0.2,   0.5e-3, 200e-6),
+    ("Air gap",          0.026, 1e-3,   200e-6),
+    ("Skin (epidermis)", 0.21,  0.1e-3, 200e-6),
+], dtype=[("name", "U20"), ("k", "f8"), ("L", "f8"), ("A", "f8")])
+
+k = layers["k"]
+L = layers["L"]
+A = layers["A"]
+R = L / (k * A)
+R_total = R.sum()
+
+
+def run_part1():
+    """Skin and core temperature limits."""
+    print("\n─── SAFETY LIMITS (IEC 60601-1 / ISO 13732) ───")
+
+    print(f"{'Condition':<30} {'T_max (°C)':<12} {'Note'}")
+    print("-" * 70)
+    row = "{:<30} {:<12} {}".format
+    print("\n".join(map(row, limits["name"], limits["T_max"], limits["note"])))
+
+
+def run_part2():
+    """Average heat generation per component."""
+    print("\n─── HEAT GENERATION BY COMPONENT ───")
+    print("P = V × I  |  Q = P × t\n")
+
+    print(f"{'Component':<24} {'Peak (mW)':<12} {'Duty':<8} {'Avg (mW)':<12} {'Note'}")
+    print("-" * 70)
+    row = "{:<24} {:<12.3f} {:<8.3f} {:<12.4f} {}".format
+    print("\n".join(map(row, components["name"], components["P_mW"], components["duty"],
+                       avg_mW, components["desc"])))
+
+    print(f"\n{'TOTAL AVERAGE':<24} {'—':<12} {'—':<8} {total_avg:<12.4f} mW")
+
+
+def run_part3():
+    """Thermal resistance of the die-to-skin stack."""
+    print("\n─── THERMAL MODEL ───")
+    print("ΔT = P × R_thermal")
+    print("R_thermal = thickness / (k × area)\n")
+
+    print(f"{'Layer':<20} {'k (W/m·K)':<12} {'L (mm)':<10} {'A (mm²)':<10} {'R_th (K/W)'}")
+    print("-" * 70)
+    row = "{:<20} {:<12.3f} {:<10.2f} {:<10.1f} {:<10.1f}".format
+    print("\n".join(map(row, layers["name"], k, L * 1e3, A * 1e6, R)))
+
+    print(f"\n{'TOTAL R_thermal':<20} {'':12} {'':10} {'':10} {R_total:<10.1f} K/W")
+
+
+def run_part4():
+    """Skin temperature rise across power levels."""
+    # Temperature rise for various power levels
+    print("\n─── TEMPERATURE RISE AT SKIN ───")
+    print(f"Ambient skin temp: 33°C  |  Safety limit: 43°C  |  Budget: 10°C\n")
+
+    powers_mW = [0.01, 0.05, 0.1, 0.5, 1, 5, 10, 50, 100]
+    print(f"{'Power (mW)':<14} {'ΔT (°C)':<12} {'T_skin (°C)':<14} {'Status'}")
+    print("-" * 55)
+    P = np.array(powers_mW)
     dT = P * 1e-3 * R_total
     T_skin = 33 + dT
-    if T_skin < 40:
-        status = "SAFE"
-    elif T_skin < 43:
-        status = "CAUTION"
-    elif T_skin < 48:
-        status = "WARNING"
-    else:
-        status = "DANGER"
-    print(f"{P:<14.3f} {dT:<12.4f} {T_skin:<14.4f} {status}")
-
-# ─── Graphene Heat Spreader Benefit ───
-print("\n─── GRAPHENE HEAT SPREADER IMPROVEMENT ───")
-print("Graphene k = 3000 W/m·K (vs FR4 k = 0.3)\n")
-
-# Replace PCB layer with graphene composite
-R_graphene_pcb = 1e-3 / (3000 * 100e-6)
-R_improved = R_total - (1e-3 / (0.3 * 100e-6)) + R_graphene_pcb
-
-print(f"Standard R_total:  {R_total:.1f} K/W")
-print(f"With graphene:     {R_improved:.1f} K/W")
-print(f"Improvement:       {(1 - R_improved/R_total)*100:.1f}%")
-print(f"\nAt 1 mW: Standard ΔT = {1e-3*R_total:.3f}°C → Graphene ΔT = {1e-3*R_improved:.3f}°C")
-
-print("\n─── CONCLUSION ───")
-print(f"Total wearable avg power: {total_avg:.4f} mW")
-print(f"Skin temperature rise:    {total_avg*1e-3*R_total:.6f}°C")
-print(f"Result: SAFE — negligible thermal impact at these power levels")
-print(f"Even at 10 mW sustained, ΔT < 1°C — well within safety margins")
+    status = np.select([T_skin < 40, T_skin < 43, T_skin < 48], ["SAFE", "CAUTION", "WARNING"], default="DANGER")
+    for P_i, dT_i, T_i, status_i in zip(P, dT, T_skin, status):
+        print(f"{P_i:<14.3f} {dT_i:<12.4f} {T_i:<14.4f} {status_i}")
+
+
+def run_part5():
+    """Graphene heat spreader in place of the FR4 layer."""
+    print("\n─── GRAPHENE HEAT SPREADER IMPROVEMENT ───")
+    print("Graphene k = 3000 W/m·K (vs FR4 k = 0.3)\n")
+
+    # Replace PCB layer with graphene composite
+    R_graphene_pcb = 1e-3 / (3000 * 100e-6)
+    R_improved = R_total - (1e-3 / (0.3 * 100e-6)) + R_graphene_pcb
+
+    print(f"Standard R_total:  {R_total:.1f} K/W")
+    print(f"With graphene:     {R_improved:.1f} K/W")
+    print(f"Improvement:       {(1 - R_improved/R_total)*100:.1f}%")
+    print(f"\nAt 1 mW: Standard ΔT = {1e-3*R_total:.3f}°C → Graphene ΔT = {1e-3*R_improved:.3f}°C")
+
+
+def run_summary():
+    print("\n─── CONCLUSION ───")
+    print(f"Total wearable avg power: {total_avg:.4f} mW")
+    print(f"Skin temperature rise:    {total_avg*1e-3*R_total:.6f}°C")
+    print(f"Result: SAFE — negligible thermal impact at these power levels")
+    print(f"Even at 10 mW sustained, ΔT < 1°C — well within safety margins")
+
+
+PARTS = {1: run_part1, 2: run_part2, 3: run_part3, 4: run_part4, 5: run_part5}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Thermal Safety Model for Wearable Electronics")
+    parser.add_argument("-p", "--part", type=int, action="append", choices=sorted(PARTS),
+                        help="run only this part (repeatable); default runs all parts and the conclusion")
+    args = parser.parse_args(argv)
+
+    print("Thermal Safety Model for Wearable Electronics")
+    print("=" * 70)
+
+    for n in args.part or sorted(PARTS):
+        PARTS[n]()
+    if not args.part:
+        run_summary()
+
+
+if __name__ == "__main__":
+    main()